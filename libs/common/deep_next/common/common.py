@@ -3,6 +3,21 @@ import textwrap
 from dotenv import load_dotenv
 from loguru import logger
 
+# Dedented once here; dedenting after interpolation also depended on the indentation
+# of the issue content.
+_ISSUE_STATEMENT_TMPL = textwrap.dedent(
+    """\
+    # Issue title:
+    {issue_title}
+
+    # Issue description:
+    {issue_description}
+
+    # Issue comment:
+    {issue_comments}
+    """
+)
+
 
 def load_monorepo_dotenv() -> None:
     """Loads the .env file from the monorepo root."""
@@ -48,15 +63,8 @@ def prepare_issue_statement(
     else:
         issue_comments_str = "\n\n".join([f"- {comment}" for comment in issue_comments])
 
-    return textwrap.dedent(
-        f"""\
-        # Issue title:
-        {issue_title}
-
-        # Issue description:
-        {issue_description}
-
-        # Issue comment:
-        {issue_comments_str}
-        """
+    return _ISSUE_STATEMENT_TMPL.format(
+        issue_title=issue_title,
+        issue_description=issue_description,
+        issue_comments=issue_comments_str,
     )
@@ -0,0 +1,30 @@
+from deep_next.common.common import prepare_issue_statement
+
+
+def test_prepare_issue_statement() -> None:
+    issue_statement = prepare_issue_statement(
+        issue_title="Title",
+        issue_description="First line\nSecond line {not a field}",
+        issue_comments=["a", "b"],
+    )
+
+    assert issue_statement == (
+        "# Issue title:\n"
+        "Title\n"
+        "\n"
+        "# Issue description:\n"
+        "First line\nSecond line {not a field}\n"
+        "\n"
+        "# Issue comment:\n"
+        "- a\n\n- b\n"
+    )
+
+
+def test_prepare_issue_statement_without_content() -> None:
+    issue_statement = prepare_issue_statement(
+        issue_title="", issue_description="", issue_comments=[]
+    )
+
+    assert "<No title>" in issue_statement
+    assert "<No description>" in issue_statement
+    assert "<No comments>" in issue_statement
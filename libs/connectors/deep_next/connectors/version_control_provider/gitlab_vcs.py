@@ -1,6 +1,16 @@
+import copy
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property
+from typing import Iterable, Iterator
 
 import gitlab
+import requests
 from deep_next.app.common import format_comment_with_header
 from deep_next.app.config import Label
 from deep_next.connectors.version_control_provider.base import (
@@ -9,12 +19,29 @@ from deep_next.connectors.version_control_provider.base import (
     BaseIssue,
     BaseMR,
 )
-from deep_next.connectors.version_control_provider.utils import label_to_str
+from deep_next.connectors.version_control_provider.utils import (
+    RateLimiter,
+    TTLCache,
+    label_to_str,
+)
+from gitlab.base import RESTObject
+from gitlab.mixins import ListMixin
 from gitlab.v4.objects.discussions import ProjectIssueDiscussion
 from gitlab.v4.objects.issues import ProjectIssue
 from gitlab.v4.objects.merge_requests import ProjectMergeRequest
+from gitlab.v4.objects.projects import Project
 from loguru import logger
 
+_PER_PAGE = 100
+_MAX_CONCURRENT_PAGE_REQUESTS = 20
+
+_RESOURCE_CACHE_MAXSIZE = 512
+_RESOURCE_CACHE_TTL_S = 60
+
+# When fewer requests than this remain in GitLab's rate limit window, wait for reset.
+_RATE_LIMIT_REMAINING_THRESHOLD = 10
+_RATE_LIMIT_MAX_WAIT_S = 60
+
 
 class GitLabConnectorError(Exception):
     """Generic GitLab connector error."""
@@ -24,9 +51,114 @@ class ResourceNotFoundError(GitLabConnectorError):
     """Resource not found error."""
 
 
-def filter_by_label(issues_or_mrs: list, label: str) -> list:
-    """Filter issues or labels by label."""
-    return [issue_or_mr for issue_or_mr in issues_or_mrs if label in issue_or_mr.labels]
+class _RateLimitedSession(requests.Session):
+    """Session backing off before GitLab's rate limit is hit, optionally throttled.
+
+    Note: 429 responses themselves are retried by python-gitlab (`Retry-After`).
+    """
+
+    def __init__(self, max_requests_per_sec: float | None = None):
+        super().__init__()
+        self._limiter = (
+            RateLimiter(max_requests_per_sec) if max_requests_per_sec else None
+        )
+
+        # When GitLab reports the limit is almost used up, all requests of the session
+        # wait until this `time.monotonic()` time.
+        self._resume_at = 0.0
+        self._resume_at_lock = threading.Lock()
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if (wait := self._resume_at - time.monotonic()) > 0:
+            time.sleep(wait)
+        if self._limiter is not None:
+            self._limiter.acquire()
+
+        response = super().send(request, **kwargs)
+        self._pause_if_limit_low(response)
+
+        return response
+
+    def _pause_if_limit_low(self, response: requests.Response) -> None:
+        remaining = response.headers.get("RateLimit-Remaining")
+        reset_at = response.headers.get("RateLimit-Reset")
+        if remaining is None or reset_at is None:
+            return
+
+        try:
+            remaining, reset_at = int(remaining), int(reset_at)
+        except ValueError:
+            logger.warning(
+                f"Malformed GitLab rate limit headers: {remaining=}, {reset_at=}"
+            )
+            return
+
+        if remaining >= _RATE_LIMIT_REMAINING_THRESHOLD:
+            return
+
+        wait = min(max(reset_at - time.time(), 0), _RATE_LIMIT_MAX_WAIT_S)
+        with self._resume_at_lock:
+            resume_at = time.monotonic() + wait
+            if resume_at <= self._resume_at:
+                return
+            self._resume_at = resume_at
+
+        logger.warning(f"GitLab rate limit almost reached, pausing for {wait:.0f}s")
+
+
+def _list_all(manager: ListMixin, **kwargs) -> list[RESTObject]:
+    """Fetch all items of a listing, requesting pages after the first concurrently.
+
+    GitLab omits the `x-total-pages` header for result sets above 10k items. In that
+    case the listing falls back to following the `next` links one page at a time.
+    """
+    first_page = manager.list(iterator=True, per_page=_PER_PAGE, **kwargs)
+
+    total_pages = first_page.total_pages
+    if total_pages is None or total_pages <= 1:
+        return list(first_page)
+
+    # First page is full when there are more pages, so it's never re-fetched here.
+    items = list(itertools.islice(first_page, _PER_PAGE))
+
+    def fetch_page(page: int) -> list[RESTObject]:
+        return manager.list(page=page, per_page=_PER_PAGE, **kwargs)
+
+    n_workers = min(_MAX_CONCURRENT_PAGE_REQUESTS, total_pages - 1)
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        for page_items in executor.map(fetch_page, range(2, total_pages + 1)):
+            items.extend(page_items)
+
+    return items
+
+
+def _count_all(manager: ListMixin, **kwargs) -> int:
+    """Count items of a listing from the `x-total` header of a single item page.
+
+    GitLab omits the header for result sets above 10k items, then items are counted
+    by listing them all.
+    """
+    total = manager.list(iterator=True, per_page=1, **kwargs).total
+    if total is None:
+        return len(_list_all(manager, **kwargs))
+
+    return total
+
+
+def filter_by_label(issues_or_mrs: Iterable, label: str) -> Iterator:
+    """Lazily filter issues or MRs by label.
+
+    Note: Listings are filtered by GitLab itself, use it only for already fetched
+        objects.
+    """
+    return (
+        issue_or_mr for issue_or_mr in issues_or_mrs if issue_or_mr.has_label(label)
+    )
+
+
+def _label_filter(label: str | None) -> dict:
+    """Query params for server side filtering by label."""
+    return {"labels": [label]} if label else {}
 
 
 class GitLabComment(BaseComment):
@@ -46,10 +178,20 @@ class GitLabComment(BaseComment):
 
 
 class GitLabIssue(BaseIssue):
-    def __init__(self, issue: ProjectIssue):
+    def __init__(
+        self,
+        issue: ProjectIssue,
+        project: Project,
+        resource_cache: TTLCache | None = None,
+    ):
         self._issue = issue
+        self._project = project
+        self._resource_cache = resource_cache
         self._discussion: ProjectIssueDiscussion | None = None
 
+        self._defer_labels_save = False
+        self._labels_changed = False
+
     @property
     def url(self) -> str:
         return self._issue.web_url
@@ -58,6 +200,18 @@ class GitLabIssue(BaseIssue):
     def labels(self) -> list[str]:
         return self._issue.labels
 
+    @cached_property
+    def _labels_set(self) -> set[str]:
+        return set(self._issue.labels)
+
+    @property
+    def has_labels(self) -> bool:
+        """Whether the issue has any labels, as known from the fetched issue data."""
+        return bool(self._issue.labels)
+
+    def has_label(self, label: str | Enum) -> bool:
+        return label_to_str(label) in self._labels_set
+
     @property
     def no(self) -> int:
         return self._issue.iid
@@ -85,47 +239,107 @@ class GitLabIssue(BaseIssue):
         if info_header:
             comment = format_comment_with_header(comment)
 
+        body = self.prettify_comment(comment)
+        if file_content:
+            body += f"\n\nAttached file: {self._upload_file(file_name, file_content)}"
+
         if self._discussion is None:
             self._discussion = self._issue.discussions.create(
                 {"body": self.comment_thread_header}
             )
 
-        self._discussion.notes.create({"body": self.prettify_comment(comment)})
-
-        if file_content:
-            self._add_file_attachment(file_name, file_content)
+        self._discussion.notes.create({"body": body})
+        self._invalidate_cache()
 
-    def _add_file_attachment(self, filename: str, content: str) -> str:
-        """Upload a text file and attach it to the issue."""
-        project_id = self._issue.project_id
-        gl = self._issue.manager.gitlab
+    def _upload_file(self, filename: str, content: str) -> str:
+        """Upload a text file to the project and return its markdown link."""
+        uploaded_file = self._project.upload(filename, filedata=content)
 
-        project = gl.projects.get(project_id)
+        return uploaded_file["markdown"]
 
-        uploaded_file = project.upload(filename, filedata=content)
+    def set_labels(self, labels: list[str | Enum]) -> None:
+        """Replace all issue labels at once."""
+        self._issue.labels = list(dict.fromkeys(label_to_str(x) for x in labels))
+        self._save_labels()
+
+    def add_label(self, *labels: str | Enum) -> None:
+        new_labels = [
+            label
+            for label in dict.fromkeys(label_to_str(x) for x in labels)
+            if label not in self._labels_set
+        ]
+        if not new_labels:
+            return
 
-        comment = f"Attached file: {uploaded_file['markdown']}"
-        self.add_comment(comment)
+        self._issue.labels = self._issue.labels + new_labels
+        self._save_labels()
 
-        return uploaded_file["markdown"]
+    def remove_label(self, *labels: str | Enum) -> None:
+        if not self.has_labels:
+            logger.warning(f"Issue #{self.no} has no labels to remove")
+            return
 
-    def add_label(self, label: str | Enum) -> None:
-        self._issue.labels.append(label_to_str(label))
-        self._issue.save()
+        to_remove = set()
+        for label in map(label_to_str, labels):
+            if label not in self._labels_set:
+                logger.warning(f"Label '{label}' not found in issue #{self.no}")
+                continue
+            to_remove.add(label)
 
-    def remove_label(self, label: str | Enum) -> None:
-        label = label_to_str(label)
-        if label not in self._issue.labels:
-            logger.warning(f"Label '{label}' not found in issue #{self.no}")
+        if not to_remove:
             return
 
-        self._issue.labels = [x for x in self._issue.labels if x != label]
-        self._issue.save()
+        self._issue.labels = [x for x in self._issue.labels if x not in to_remove]
+        self._save_labels()
+
+    @contextmanager
+    def batch_labels(self) -> Iterator["GitLabIssue"]:
+        """Collect label changes made within the block and save them once.
+
+        If the block raises, its label changes are discarded.
+
+        Example:
+            > with issue.batch_labels():
+            >     issue.remove_label(Label.TODO)
+            >     issue.add_label(Label.IN_PROGRESS)
+        """
+        labels, labels_changed = self._issue.labels, self._labels_changed
+        self._defer_labels_save = True
+        try:
+            yield self
+        except BaseException:
+            # Don't leave half-applied changes for the next save to push.
+            self._issue.labels, self._labels_changed = labels, labels_changed
+            self.__dict__.pop("_labels_set", None)
+            raise
+        finally:
+            self._defer_labels_save = False
+
+        self.flush()
+
+    def flush(self) -> None:
+        """Save pending label changes, if any."""
+        if self._labels_changed:
+            self._issue.save()
+            self._labels_changed = False
+            self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        if self._resource_cache is not None:
+            self._resource_cache.pop(("issue", self.no))
+
+    def _save_labels(self) -> None:
+        self.__dict__.pop("_labels_set", None)
+        self._labels_changed = True
+        if not self._defer_labels_save:
+            self.flush()
 
 
 class GitLabMR(BaseMR):
-    def __init__(self, mr: ProjectMergeRequest):
+    def __init__(self, mr: ProjectMergeRequest, resource_cache: TTLCache | None = None):
         self._mr = mr
+        self._resource_cache = resource_cache
+        self._changes: list[dict] | None = None
 
     @property
     def source_branch_name(self) -> str:
@@ -151,49 +365,68 @@ class GitLabMR(BaseMR):
     def description(self) -> str:
         return self._mr.description
 
-    @property
+    @cached_property
     def base_commit(self) -> str:
         """Base commit for MR (the one on which changes are applied)."""
         return self._mr.diff_refs["start_sha"]
 
+    def invalidate(self) -> None:
+        """Drop cached diff data, e.g. after new commits were pushed to the MR."""
+        self.__dict__.pop("base_commit", None)
+        self._changes = None
+
     def git_diff(self) -> str:
         """Retrieve the full git diff for a given merge request."""
-        diffs = self._mr.changes()["changes"]
+        if self._changes is None:
+            self._changes = self._mr.changes()["changes"]
 
-        diff_output = []
-        for change in diffs:
+        return "\n".join(self._iter_diff_lines(self._changes))
+
+    @staticmethod
+    def _iter_diff_lines(changes: list[dict]) -> Iterator[str]:
+        """Yield git diff lines for MR changes without building them up front."""
+        for change in changes:
             before_filepath = change["old_path"]
             after_filepath = change["new_path"]
 
             if before_filepath != after_filepath:
-                diff_output.append(f"rename from {before_filepath}")
-                diff_output.append(f"rename to {after_filepath}")
+                yield "rename from " + before_filepath
+                yield "rename to " + after_filepath
             else:
-                diff_output.append(f"diff --git a/{before_filepath} b/{after_filepath}")
-
-            diff_output.append(f"--- a/{before_filepath}")
-            diff_output.append(f"+++ b/{after_filepath}")
+                yield "diff --git a/" + before_filepath + " b/" + after_filepath
 
-            diff_output.append(change["diff"])
+            yield "--- a/" + before_filepath
+            yield "+++ b/" + after_filepath
 
-        return "\n".join(diff_output)
+            yield change["diff"]
 
     @property
     def labels(self) -> list[str]:
         """Returns the labels of the MR."""
         return self._mr.labels
 
+    @cached_property
+    def _labels_set(self) -> set[str]:
+        return set(self._mr.labels)
+
+    def has_label(self, label: str | Label) -> bool:
+        return label_to_str(label) in self._labels_set
+
     def add_label(self, label: str | Label):
         """Add a label to the MR."""
         label = label_to_str(label)
         # TODO: Replace with the proper implementation.
         self._mr.add_to_labels(label)
+        self.__dict__.pop("_labels_set", None)
+        self._invalidate_cache()
 
     def remove_label(self, label: str | Label):
         """Remove a label from the MR."""
         label = label_to_str(label)
         # TODO: Replace with the proper implementation.
         self._mr.remove_from_labels(label)
+        self.__dict__.pop("_labels_set", None)
+        self._invalidate_cache()
 
     def add_comment(
         self, comment: str, info_header: bool = False, log: int | str | None = None
@@ -206,34 +439,96 @@ class GitLabMR(BaseMR):
             logger.log(log, comment)
 
         self._mr.notes.create({"body": comment})
+        self._invalidate_cache()
 
     @property
     def comments(self) -> list[BaseComment]:
-        """Returns the comments of the MR."""
-        # TODO: Replace with the proper implementation.
-        return [GitLabComment(comment) for comment in self._mr.notes.list()]
+        """Returns the comments of the MR, oldest first."""
+        notes = _list_all(self._mr.notes, order_by="created_at", sort="asc")
+        return [GitLabComment(note) for note in notes]
+
+    def iter_comments(self, since: datetime | None = None) -> Iterator[GitLabComment]:
+        """Lazily yield the MR comments, most recently updated first.
+
+        Args:
+            since: If given, stop at the first comment not updated after this time.
+                A naive datetime is taken as UTC.
+        """
+        if since is not None and since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        notes = self._mr.notes.list(
+            iterator=True, per_page=_PER_PAGE, order_by="updated_at", sort="desc"
+        )
+        for note in notes:
+            if since is not None and datetime.fromisoformat(note.updated_at) <= since:
+                return
+
+            yield GitLabComment(note)
+
+    def _invalidate_cache(self) -> None:
+        if self._resource_cache is not None:
+            self._resource_cache.pop(("mr", self.no))
 
 
 class GitLabConnector(BaseConnector):
-    def __init__(self, *_, access_token: str, repo_name: str, base_url: str):
-        """Create connection with GitLab project."""
+    def __init__(
+        self,
+        *_,
+        access_token: str,
+        repo_name: str,
+        base_url: str,
+        max_requests_per_sec: float | None = None,
+    ):
+        """Create connection with GitLab project.
+
+        Args:
+            max_requests_per_sec: Client side throttling of API requests, off by
+                default. GitLab's own limit is respected either way.
+        """
         self.repo_name = repo_name
 
-        self.connector = gitlab.Gitlab(base_url, private_token=access_token)
+        self.connector = gitlab.Gitlab(
+            base_url,
+            private_token=access_token,
+            retry_transient_errors=True,
+            session=_RateLimitedSession(max_requests_per_sec),
+        )
         self.project = self.connector.projects.get(self.repo_name)
 
         self.project_id = self.project.id
 
+        # Attributes of single issues and MRs fetched by `(kind, iid)`, dropped on
+        # every write. Listings return fewer fields, so they never fill the cache.
+        # Each lookup builds new objects, so callers never share state.
+        self._resource_cache = TTLCache(
+            maxsize=_RESOURCE_CACHE_MAXSIZE, ttl=_RESOURCE_CACHE_TTL_S
+        )
+
     def list_issues(self, label: str | Enum | None = None) -> list[GitLabIssue]:
         """Fetches all issues"""
         label = label_to_str(label)
-        all_issues = self.project.issues.list(all=True)
-        issues = filter_by_label(all_issues, label) if label else all_issues
+        issues = _list_all(self.project.issues, **_label_filter(label))
 
-        return [GitLabIssue(issue) for issue in issues]
+        return [
+            GitLabIssue(
+                issue, project=self.project, resource_cache=self._resource_cache
+            )
+            for issue in issues
+        ]
+
+    def count_issues(self, label: str | Enum | None = None) -> int:
+        """Counts issues without fetching them."""
+        return _count_all(self.project.issues, **_label_filter(label_to_str(label)))
 
     def get_issue(self, issue_no: int) -> GitLabIssue:
         """Fetches a single issue."""
+        if attrs := self._resource_cache.get(("issue", issue_no)):
+            issue = ProjectIssue(self.project.issues, copy.deepcopy(attrs))
+            return GitLabIssue(
+                issue, project=self.project, resource_cache=self._resource_cache
+            )
+
         try:
             issue: ProjectIssue = self.project.issues.get(issue_no)
         except gitlab.exceptions.GitlabGetError as e:
@@ -244,17 +539,30 @@ class GitLabConnector(BaseConnector):
                     f"Error while fetching issue #{issue_no}: {e}"
                 ) from None
 
-        return GitLabIssue(issue)
+        self._resource_cache.set(("issue", issue_no), issue.asdict())
+        return GitLabIssue(
+            issue, project=self.project, resource_cache=self._resource_cache
+        )
 
-    def list_mrs(self, label: str | None = None) -> list[GitLabMR]:
+    def list_mrs(self, label: str | Label | None = None) -> list[GitLabMR]:
         """Fetches all MRs"""
-        all_mrs = self.project.mergerequests.list(all=True)
-        mrs = filter_by_label(all_mrs, label) if label else all_mrs
+        label = label_to_str(label)
+        mrs = _list_all(self.project.mergerequests, **_label_filter(label))
 
-        return [GitLabMR(mr) for mr in mrs]
+        return [GitLabMR(mr, resource_cache=self._resource_cache) for mr in mrs]
+
+    def count_mrs(self, label: str | Label | None = None) -> int:
+        """Counts MRs without fetching them."""
+        return _count_all(
+            self.project.mergerequests, **_label_filter(label_to_str(label))
+        )
 
     def get_mr(self, mr_no: int) -> GitLabMR:
         """Fetches a single merge request."""
+        if attrs := self._resource_cache.get(("mr", mr_no)):
+            mr = ProjectMergeRequest(self.project.mergerequests, copy.deepcopy(attrs))
+            return GitLabMR(mr, resource_cache=self._resource_cache)
+
         try:
             mr: ProjectMergeRequest = self.project.mergerequests.get(mr_no)
         except gitlab.exceptions.GitlabGetError as e:
@@ -265,7 +573,8 @@ class GitLabConnector(BaseConnector):
                     f"Error while fetching MR #{mr_no}: {e}"
                 ) from e
 
-        return GitLabMR(mr)
+        self._resource_cache.set(("mr", mr_no), mr.asdict())
+        return GitLabMR(mr, resource_cache=self._resource_cache)
 
     def create_mr(
         self,
@@ -291,4 +600,4 @@ class GitLabConnector(BaseConnector):
         except gitlab.exceptions.GitlabGetError as e:
             raise GitLabConnectorError(f"Error while creating MR: {e}") from e
 
-        return GitLabMR(mr)
+        return GitLabMR(mr, resource_cache=self._resource_cache)
@@ -1,6 +1,12 @@
+import threading
+import time
+from collections import OrderedDict
 from enum import Enum
+from functools import lru_cache
+from typing import Any, Hashable
 
 
+@lru_cache(maxsize=64)
 def label_to_str(label: str | Enum | None) -> str | None:
     """Convert label to string."""
     if label is None:
@@ -9,3 +15,67 @@ def label_to_str(label: str | Enum | None) -> str | None:
     if isinstance(label, Enum):
         return label.value
     return label
+
+
+class TTLCache:
+    """Minimal in-memory LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Returns the cached value or None if missing or expired."""
+        try:
+            expires_at, value = self._data[key]
+        except KeyError:
+            return None
+
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Caches the value, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drops the entry, if cached."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing on average `rate` calls per second."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until the call fits within the rate."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.rate, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+
+            # Tokens may go negative, so concurrent callers queue up behind each other.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait:
+            time.sleep(wait)
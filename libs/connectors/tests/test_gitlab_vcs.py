@@ -0,0 +1,354 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+import pytest
+import requests
+from deep_next.connectors.version_control_provider import gitlab_vcs
+from deep_next.connectors.version_control_provider.gitlab_vcs import (
+    GitLabConnector,
+    GitLabIssue,
+    GitLabMR,
+    _count_all,
+    _list_all,
+    _RateLimitedSession,
+)
+from gitlab.v4.objects.issues import ProjectIssue, ProjectIssueManager
+from gitlab.v4.objects.merge_requests import (
+    ProjectMergeRequest,
+    ProjectMergeRequestManager,
+)
+from gitlab.v4.objects.projects import ProjectManager
+
+
+class _FakeListing:
+    def __init__(self, items: list[int], total_pages: int | None):
+        self._items = iter(items)
+        self.total_pages = total_pages
+        self.total = len(items) if total_pages is not None else None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> int:
+        return next(self._items)
+
+
+class _FakeManager:
+    def __init__(self, n_items: int, report_total_pages: bool = True):
+        self._items = list(range(n_items))
+        self._report_total_pages = report_total_pages
+        self.requested_pages: list[int] = []
+
+    def list(self, iterator: bool = False, page: int = 1, per_page: int = 20):
+        n_pages = max(1, -(-len(self._items) // per_page))
+
+        if iterator:
+            self.requested_pages.append(1)
+            total_pages = n_pages if self._report_total_pages else None
+            return _FakeListing(self._items, total_pages)
+
+        self.requested_pages.append(page)
+        return self._items[(page - 1) * per_page : page * per_page]
+
+
+@pytest.mark.parametrize("n_items", [0, 1, 100, 101, 250, 1000])
+def test_list_all_returns_all_items_in_order(n_items: int) -> None:
+    manager = _FakeManager(n_items)
+
+    assert _list_all(manager) == list(range(n_items))
+
+
+def test_list_all_requests_each_page_once() -> None:
+    manager = _FakeManager(350)
+
+    _list_all(manager)
+
+    assert sorted(manager.requested_pages) == [1, 2, 3, 4]
+
+
+def test_list_all_without_total_pages_header() -> None:
+    manager = _FakeManager(350, report_total_pages=False)
+
+    assert _list_all(manager) == list(range(350))
+    assert manager.requested_pages == [1]
+
+
+@pytest.mark.parametrize("report_total_pages", [True, False])
+def test_count_all(report_total_pages: bool) -> None:
+    manager = _FakeManager(350, report_total_pages=report_total_pages)
+
+    assert _count_all(manager) == 350
+
+
+class _FakeIssue:
+    def __init__(self, labels: list[str]):
+        self.iid = 1
+        self.project_id = 1
+        self.labels = labels
+        self.n_saves = 0
+
+    def save(self) -> None:
+        self.n_saves += 1
+
+
+def _gitlab_issue(labels: list[str]) -> GitLabIssue:
+    return GitLabIssue(_FakeIssue(labels), project=None)
+
+
+def test_add_label_skips_existing_labels() -> None:
+    issue = _gitlab_issue(["a"])
+
+    issue.add_label("a", "b", "b")
+
+    assert issue.labels == ["a", "b"]
+    assert issue._issue.n_saves == 1
+
+
+def test_remove_label_without_match_does_not_save() -> None:
+    issue = _gitlab_issue(["a"])
+
+    issue.remove_label("b")
+
+    assert issue.labels == ["a"]
+    assert issue._issue.n_saves == 0
+
+
+def test_batch_labels_saves_once() -> None:
+    issue = _gitlab_issue(["a", "b"])
+
+    with issue.batch_labels():
+        issue.remove_label("a")
+        issue.add_label("c")
+        issue.add_label("d")
+
+    assert issue.labels == ["b", "c", "d"]
+    assert issue._issue.n_saves == 1
+
+
+def test_remove_label_from_issue_without_labels() -> None:
+    issue = _gitlab_issue([])
+
+    issue.remove_label("a")
+
+    assert not issue.has_labels
+    assert issue._issue.n_saves == 0
+
+
+class _FakeMR:
+    def __init__(self, changes: list[dict]):
+        self._changes = changes
+        self.n_changes_requests = 0
+
+    def changes(self) -> dict:
+        self.n_changes_requests += 1
+        return {"changes": self._changes}
+
+
+class _GitLabMR(GitLabMR):
+    related_issue = None
+
+
+def test_mr_git_diff() -> None:
+    mr = _GitLabMR(
+        _FakeMR(
+            [
+                {"old_path": "a.py", "new_path": "a.py", "diff": "@@ -1 +1 @@"},
+                {"old_path": "b.py", "new_path": "c.py", "diff": ""},
+            ]
+        )
+    )
+
+    expected = (
+        "diff --git a/a.py b/a.py\n"
+        "--- a/a.py\n"
+        "+++ b/a.py\n"
+        "@@ -1 +1 @@\n"
+        "rename from b.py\n"
+        "rename to c.py\n"
+        "--- a/b.py\n"
+        "+++ b/c.py\n"
+    )
+    assert mr.git_diff() == expected
+    assert mr.git_diff() == expected
+    assert mr._mr.n_changes_requests == 1
+
+
+def test_has_label_follows_label_changes() -> None:
+    issue = _gitlab_issue(["a"])
+    assert issue.has_label("a")
+
+    with issue.batch_labels():
+        issue.remove_label("a")
+        issue.add_label("b")
+
+        assert not issue.has_label("a")
+        assert issue.has_label("b")
+
+
+def test_batch_labels_discards_changes_on_error() -> None:
+    issue = _gitlab_issue(["a"])
+
+    with pytest.raises(RuntimeError):
+        with issue.batch_labels():
+            issue.remove_label("a")
+            issue.add_label("b")
+            raise RuntimeError()
+
+    assert issue.labels == ["a"]
+    assert issue.has_label("a")
+    assert issue._issue.n_saves == 0
+
+    issue.flush()
+    assert issue._issue.n_saves == 0
+
+
+class _FakeNote:
+    def __init__(self, body: str, updated_at: str):
+        self.body = body
+        self.updated_at = updated_at
+
+
+class _FakeNotes:
+    def __init__(self, notes: list[_FakeNote]):
+        self._notes = notes
+        self.n_fetched = 0
+
+    def list(self, iterator: bool = False, **_) -> Iterator[_FakeNote]:
+        for note in self._notes:
+            self.n_fetched += 1
+            yield note
+
+
+class _FakeNotedMR:
+    def __init__(self):
+        # Most recently updated first, as requested by `iter_comments`.
+        self.notes = _FakeNotes(
+            [
+                _FakeNote("c", "2024-01-03T12:00:00.000Z"),
+                _FakeNote("b", "2024-01-02T12:00:00.000Z"),
+                _FakeNote("a", "2024-01-01T12:00:00.000Z"),
+            ]
+        )
+
+
+def test_mr_iter_comments() -> None:
+    mr = _GitLabMR(_FakeNotedMR())
+
+    assert [comment.body for comment in mr.iter_comments()] == ["c", "b", "a"]
+
+
+@pytest.mark.parametrize(
+    "since",
+    [
+        datetime(2024, 1, 2, 12, tzinfo=timezone.utc),
+        datetime(2024, 1, 2, 14, tzinfo=timezone(timedelta(hours=2))),
+        datetime(2024, 1, 2, 12),
+    ],
+)
+def test_mr_iter_comments_since(since: datetime) -> None:
+    mr = _GitLabMR(_FakeNotedMR())
+
+    assert [comment.body for comment in mr.iter_comments(since=since)] == ["c"]
+    assert mr._mr.notes.n_fetched == 2
+
+
+@pytest.fixture
+def issue_requests(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Connectors' projects are resolved offline; records fetched issue numbers."""
+    issue_requests = []
+    get_project = ProjectManager.get
+
+    def get_issue(manager: ProjectIssueManager, issue_no: int, **_) -> ProjectIssue:
+        issue_requests.append(issue_no)
+        return ProjectIssue(manager, {"iid": issue_no, "labels": ["a"]})
+
+    monkeypatch.setattr(
+        ProjectManager, "get", lambda self, id, **_: get_project(self, 1, lazy=True)
+    )
+    monkeypatch.setattr(ProjectIssueManager, "get", get_issue)
+
+    return issue_requests
+
+
+def _connector(base_url: str = "https://gitlab.example.com") -> GitLabConnector:
+    return GitLabConnector(access_token="token", repo_name="repo", base_url=base_url)
+
+
+def test_get_issue_cached_without_sharing_objects(issue_requests: list[int]) -> None:
+    connector = _connector()
+
+    issue = connector.get_issue(1)
+    issue._issue.labels = ["b"]
+    cached_issue = connector.get_issue(1)
+
+    assert cached_issue is not issue
+    assert cached_issue.labels == ["a"]
+    assert issue_requests == [1]
+
+
+def test_get_issue_cache_is_per_connector(issue_requests: list[int]) -> None:
+    _connector("https://a.example.com").get_issue(1)
+    _connector("https://b.example.com").get_issue(1)
+
+    assert issue_requests == [1, 1]
+
+
+def test_get_mr_after_list_mrs_fetches_full_mr(
+    issue_requests: list[int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mr_requests = []
+
+    def list_mrs(manager: ProjectMergeRequestManager, **_) -> list:
+        return [ProjectMergeRequest(manager, {"iid": 1, "labels": []})]
+
+    def get_mr(manager: ProjectMergeRequestManager, mr_no: int, **_):
+        mr_requests.append(mr_no)
+        return ProjectMergeRequest(
+            manager, {"iid": mr_no, "labels": [], "diff_refs": {"start_sha": "abc"}}
+        )
+
+    monkeypatch.setattr(gitlab_vcs, "GitLabMR", _GitLabMR)
+    monkeypatch.setattr(gitlab_vcs, "_list_all", list_mrs)
+    monkeypatch.setattr(ProjectMergeRequestManager, "get", get_mr)
+    connector = _connector()
+
+    connector.list_mrs()
+    assert connector.get_mr(1).base_commit == "abc"
+    assert connector.get_mr(1).base_commit == "abc"
+    assert mr_requests == [1]
+
+
+def _rate_limited_response(remaining: int, reset_in_s: int) -> requests.Response:
+    response = requests.Response()
+    response.headers["RateLimit-Remaining"] = str(remaining)
+    response.headers["RateLimit-Reset"] = str(int(time.time()) + reset_in_s)
+    return response
+
+
+def test_session_pause_on_low_rate_limit_is_shared() -> None:
+    session = _RateLimitedSession()
+
+    session._pause_if_limit_low(_rate_limited_response(remaining=100, reset_in_s=30))
+    assert session._resume_at == 0.0
+
+    session._pause_if_limit_low(_rate_limited_response(remaining=1, reset_in_s=30))
+    resume_at = session._resume_at
+    assert resume_at > time.monotonic() + 20
+
+    session._pause_if_limit_low(_rate_limited_response(remaining=1, reset_in_s=5))
+    assert session._resume_at == resume_at
+
+
+@pytest.mark.parametrize("remaining, reset_at", [("", "1"), ("1", "soon")])
+def test_session_ignores_malformed_rate_limit_headers(
+    remaining: str, reset_at: str
+) -> None:
+    session = _RateLimitedSession()
+    response = requests.Response()
+    response.headers["RateLimit-Remaining"] = remaining
+    response.headers["RateLimit-Reset"] = reset_at
+
+    session._pause_if_limit_low(response)
+
+    assert session._resume_at == 0.0
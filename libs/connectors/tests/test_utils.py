@@ -0,0 +1,49 @@
+from deep_next.connectors.version_control_provider import utils
+from deep_next.connectors.version_control_provider.utils import RateLimiter, TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch) -> None:
+    now = 100.0
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now)
+    cache = TTLCache(maxsize=2, ttl=10)
+
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    now = 111.0
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache = TTLCache(maxsize=2, ttl=10)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_pop() -> None:
+    cache = TTLCache(maxsize=2, ttl=10)
+
+    cache.set("a", 1)
+    cache.pop("a")
+    cache.pop("missing")
+
+    assert cache.get("a") is None
+
+
+def test_rate_limiter_waits_when_bucket_is_empty(monkeypatch) -> None:
+    sleeps = []
+    monkeypatch.setattr(utils.time, "monotonic", lambda: 0.0)
+    monkeypatch.setattr(utils.time, "sleep", sleeps.append)
+    limiter = RateLimiter(rate=2)
+
+    for _ in range(4):
+        limiter.acquire()
+
+    assert sleeps == [0.5, 1.0]
@@ -14,6 +14,9 @@ from typing_extensions import Self
 class _WrappedCompiledStateGraph(CompiledStateGraph):
     """Wrapper for CompiledStateGraph to add setup and teardown logic."""
 
+    # Kept out of `__dict__`, which is shared with the wrapped graph.
+    __slots__ = ("_compiled_graph", "_setup_fn", "_teardown_fn")
+
     def __init__(
         self,
         compiled_graph: CompiledStateGraph,
@@ -24,7 +27,8 @@ class _WrappedCompiledStateGraph(CompiledStateGraph):
         self._setup_fn = setup_fn
         self._teardown_fn = teardown_fn
 
-        self.__dict__.update(self._compiled_graph.__dict__)
+        # Share (not copy) the attributes, so inherited methods see the same state.
+        self.__dict__ = self._compiled_graph.__dict__
 
     def invoke(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
         """Run setup -> original invoke -> teardown."""
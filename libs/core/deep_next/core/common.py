@@ -1,10 +1,22 @@
+import os
 import re
-import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from deep_next.core.io import read_txt
 from langchain_core.output_parsers import BaseOutputParser
 
+_FILE_DUMP_HEADER_TMPL = "\nPath: {abs_path}\n```python\n"
+_FILE_DUMP_FOOTER = "\n```\n"
+_FILE_DUMP_MAX_WORKERS = 32
+# Coarsest common mtime resolution (FAT); modifications within it may be invisible.
+_MTIME_GRANULARITY_NS = 2_000_000_000
+
+# Matches <think>...</think> blocks (multiline included) up to the first closing tag.
+# Unrolled loop with possessive quantifiers instead of `.*?`: it never backtracks,
+# so output with an unclosed <think> tag is rejected in linear time.
+_THINKING_BLOCK_PATTERN = re.compile(r"<think>[^<]*+(?:<(?!/think>)[^<]*+)*+</think>")
+
 
 # TODO: Remove. It's moved to common lib.
 def gitignore_name(name: str) -> str:
@@ -12,24 +24,77 @@ def gitignore_name(name: str) -> str:
     return f"___{name}"
 
 
-def dump_filepaths(file_paths: list[Path | str]) -> str:
-    """Create a dump of the contents of the given file paths."""
-    file_repr_tmpl = textwrap.dedent(
-        """
-        Path: {abs_path}
-        ```python
-        {code}
-        ```
-        """
-    )
-    file_paths = [str(Path(path).resolve()) for path in file_paths]
+class FileCache:
+    """Contents of text files, re-read only when they change on disk.
+
+    One instance is shared by all the steps of a pipeline run, so files picked for
+    the action plan aren't read again for the implementation and the code review.
+    """
+
+    def __init__(self) -> None:
+        # `{abs_path: [(mtime_ns, size), text, rendered dump block or None, racy]}`
+        self._entries: dict[Path, list] = {}
+
+    def _entry(self, abs_path: Path) -> list:
+        stat = os.stat(abs_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._entries.get(abs_path)
+        # A racy entry was read within one mtime tick of its last modification: a
+        # later write of the same size may keep the same mtime, so the stat can't
+        # be trusted and the file is read again.
+        if entry is None or entry[0] != key or entry[3]:
+            # Whole file at once, skipping the buffered text layer of `open()`.
+            text = abs_path.read_bytes().decode("utf-8")
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+            racy = time.time_ns() - stat.st_mtime_ns < _MTIME_GRANULARITY_NS
+            if entry is not None and entry[1] == text:
+                entry[0], entry[3] = key, racy
+            else:
+                entry = [key, text, None, racy]
+                self._entries[abs_path] = entry
 
-    dump = [
-        file_repr_tmpl.format(abs_path=file_path, code=read_txt(file_path))
-        for file_path in file_paths
-    ]
+        return entry
 
-    return "\n".join(dump)
+    def invalidate(self, path: Path | str) -> None:
+        """Forget the cached contents, e.g. after the file was written."""
+        self._entries.pop(Path(path).resolve(), None)
+
+    def read(self, path: Path | str) -> str:
+        """Read the text file, reusing the cached contents if it didn't change."""
+        return self._entry(Path(path).resolve())[1]
+
+    def _dump_file(self, abs_path: Path) -> str:
+        entry = self._entry(abs_path)
+        if entry[2] is None:
+            entry[2] = (
+                _FILE_DUMP_HEADER_TMPL.format(abs_path=abs_path)
+                + entry[1]
+                + _FILE_DUMP_FOOTER
+            )
+
+        return entry[2]
+
+    def dump(self, file_paths: list[Path | str]) -> str:
+        """Create a dump of the contents of the given file paths."""
+        # Kept as `Path`: it's only rendered to `str` once, for the dump header.
+        file_paths = [Path(path).resolve() for path in file_paths]
+        if not file_paths:
+            return ""
+
+        # Reads are I/O bound, so overlap them.
+        n_workers = min(_FILE_DUMP_MAX_WORKERS, len(file_paths))
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            blocks = list(executor.map(self._dump_file, file_paths))
+
+        return "\n".join(blocks)
+
+
+def dump_filepaths(file_paths: list[Path | str], file_cache: FileCache) -> str:
+    """Create a dump of the contents of the given file paths."""
+    return file_cache.dump(file_paths)
 
 
 class RemoveThinkingBlocksParser(BaseOutputParser):
@@ -44,8 +109,9 @@ class RemoveThinkingBlocksParser(BaseOutputParser):
         Returns:
             The text with <think>...</think> blocks removed
         """
-        # Pattern to match <think>...</think> blocks (handling multiline content)
-        pattern = r"<think>.*?</think>"
-        # Remove the blocks using regex with DOTALL flag to match across newlines
-        cleaned_text = re.sub(pattern, "", text, flags=re.DOTALL)
+        # Most models never emit thinking blocks, so skip the regex if there's none.
+        if "<think>" not in text:
+            return text.strip()
+
+        cleaned_text = _THINKING_BLOCK_PATTERN.sub("", text)
         return cleaned_text.strip()
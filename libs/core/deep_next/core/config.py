@@ -7,7 +7,6 @@ SRC_DIR = Path(__file__).resolve().parent  # 🛠core/deep_next/core
 ROOT_DIR = SRC_DIR.parent.parent  # 🛠core
 
 DATA_DIR = MONOREPO_DATA_PATH / "core"
-DATA_DIR.mkdir(exist_ok=True, parents=True)
 
 AUTOMATED_CODE_REVIEW_MAX_ATTEMPTS = 1
 
@@ -33,10 +32,11 @@ class SRSConfig:
     CONTEXT_WINDOW = 10
 
 
-SRF_INDEXER_IGNORE_DIR_PREFIXES = [
+# A tuple, so it can be passed straight to `str.startswith`.
+SRF_INDEXER_IGNORE_DIR_PREFIXES = (
     ".venv",
     ".git",
     ".mypy_cache",
     ".pytest_cache",
     "___",
-]
+)
@@ -1,10 +1,14 @@
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from deep_next.core.graph import DeepNextResult, deep_next_graph
-from deep_next.core.io import read_txt
 from loguru import logger
 
+if TYPE_CHECKING:
+    from deep_next.core.graph import DeepNextResult
+
 
 def main(
     problem_statement: str,
@@ -12,6 +16,9 @@ def main(
     root_dir: Path,
 ) -> DeepNextResult:
     """Deep NEXT data pipeline."""
+    # Imported here: building the graphs takes seconds, `--help` shouldn't wait.
+    from deep_next.core.graph import deep_next_graph
+
     logger.info(f"\n{problem_statement=}\n{hints=}\n{root_dir=}")
 
     # TODO: CLI will fail due to invalid interface
@@ -110,9 +117,9 @@ def cli(
     )
 
     if isinstance(problem_statement, Path):
-        problem_statement = read_txt(problem_statement)
+        problem_statement = problem_statement.read_text(encoding="utf-8")
     if isinstance(hints, Path):
-        hints = read_txt(hints)
+        hints = hints.read_text(encoding="utf-8")
 
     main(
         problem_statement=problem_statement,
@@ -1,13 +1,21 @@
 import textwrap
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
 from deep_next.common.common import prepare_issue_statement
 from deep_next.core.base_graph import BaseGraph
+from deep_next.core.common import FileCache
 from deep_next.core.config import AUTOMATED_CODE_REVIEW_MAX_ATTEMPTS
 from deep_next.core.steps.action_plan import action_plan_graph
-from deep_next.core.steps.action_plan.data_model import ActionPlan
+from deep_next.core.steps.action_plan.data_model import ActionPlan, ExistingCodeContext
+from deep_next.core.steps.action_plan.graph import define_code_context
 from deep_next.core.steps.code_review.graph import code_review_graph
+from deep_next.core.steps.gather_project_knowledge.cache import (
+    cache_project_knowledge,
+    project_knowledge_cache_key,
+    read_cached_project_knowledge,
+)
 from deep_next.core.steps.gather_project_knowledge.graph import (
     gather_project_knowledge_graph,
 )
@@ -27,55 +35,95 @@ class DeepNextResult(BaseModel):
     action_plan: str = Field(description="Action plan for the changes made.")
 
 
-class _State(BaseModel):
+_CODE_REVIEW_SUGGESTIONS_TMPL = textwrap.dedent(
+    """\
+    [Auto Code Review Suggestions]
+    An automated code review of the changes made so far suggests the improvements
+    below. These are possible improvements to the code based on best practices and
+    common patterns.
 
-    root_path: Path = Field(description="Path to the root project directory.")
-    issue_title: str = Field(description="The issue title.")
-    issue_description: str = Field(description="The issue description.")
-    issue_comments: list[str] = Field(
-        default_factory=list, description="Comments made on the issue."
-    )
+    Analyse each suggestion carefully. Not all of them need to be applied - use your
+    judgment.
 
-    project_knowledge: str | None = Field(default=None)
-    action_plan: ActionPlan | None = Field(default=None)
+    {suggestions}
+    """
+)
 
-    git_diff: str | None = Field(
-        default=None,
-        description="Final result: git diff of the changes made to the source code.",
-    )
 
-    code_review_issues: list[str] = Field(
-        default_factory=list,
-        description="Code review of the changes made to the source code.",
-    )
-    code_review_attempts: int = Field(
-        default=0, description="Number of code review retry attempts."
-    )
+@dataclass(slots=True)
+class _State:
+    """Internal state of the graph; not validated, as it never leaves the graph."""
 
-    @property
-    def issue_statement(self) -> str:
-        return prepare_issue_statement(
-            issue_title=self.issue_title,
-            issue_description=self.issue_description,
-            issue_comments=self.issue_comments,
-        )
+    root_path: Path
+    """Path to the root project directory."""
+    issue_title: str
+    issue_description: str
+    issue_comments: list[str] = field(default_factory=list)
+    """Comments made on the issue."""
+    issue_statement: str | None = None
+    """Issue title, description and comments in one prompt; built once, on creation."""
+
+    project_knowledge: str | None = None
+    code_context: ExistingCodeContext | None = None
+    """Files related to the issue, searched for alongside the project knowledge."""
+    action_plan: ActionPlan | None = None
+
+    git_diff: str | None = None
+    """Final result: git diff of the changes made to the source code."""
+
+    code_review_issues: list[tuple[str, str]] = field(default_factory=list)
+    """Code review of the changes made to the source code."""
+    code_review_attempts: int = 0
+    """Number of code review retry attempts."""
+    suggested_code_review_issues: set[str] = field(default_factory=set)
+    """Code review issues already sent back for another attempt."""
+
+    file_cache: FileCache = field(default_factory=FileCache)
+    """Cache of file contents shared by all the steps of the run."""
+
+    def __post_init__(self) -> None:
+        if self.issue_statement is None:
+            self.issue_statement = prepare_issue_statement(
+                issue_title=self.issue_title,
+                issue_description=self.issue_description,
+                issue_comments=self.issue_comments,
+            )
 
 
 class _Node:
     @staticmethod
     def gather_project_knowledge(state: _State) -> dict:
+        cache_key = project_knowledge_cache_key(state.root_path)
+        project_knowledge = read_cached_project_knowledge(cache_key)
+        if project_knowledge is not None:
+            return {"project_knowledge": project_knowledge}
+
         init_state = gather_project_knowledge_graph.create_init_state(
             root_path=state.root_path,
         )
         final_state = gather_project_knowledge_graph.compiled.invoke(init_state)
+
+        cache_project_knowledge(cache_key, final_state["project_knowledge"])
         return {"project_knowledge": final_state["project_knowledge"]}
 
+    @staticmethod
+    def define_code_context(state: _State) -> dict:
+        code_context = define_code_context(
+            root_path=state.root_path,
+            issue_statement=state.issue_statement,
+            file_cache=state.file_cache,
+        )
+
+        return {"code_context": code_context}
+
     @staticmethod
     def create_action_plan(state: _State) -> dict:
         init_state = action_plan_graph.create_init_state(
             root_path=state.root_path,
             issue_statement=state.issue_statement,
             project_knowledge=state.project_knowledge,
+            file_cache=state.file_cache,
+            code_context=state.code_context,
         )
         final_state = action_plan_graph.compiled.invoke(init_state)
 
@@ -87,6 +135,7 @@ class _Node:
             root_path=state.root_path,
             issue_statement=state.issue_statement,
             action_plan=state.action_plan,
+            file_cache=state.file_cache,
         )
         final_state = implement_graph.compiled.invoke(init_state)
 
@@ -99,6 +148,7 @@ class _Node:
             issue_statement=state.issue_statement,
             project_knowledge=state.project_knowledge,
             git_diff=state.git_diff,
+            file_cache=state.file_cache,
         )
         final_state = code_review_graph.compiled.invoke(initial_state)
 
@@ -106,35 +156,46 @@ class _Node:
 
     @staticmethod
     def prepare_automated_code_review_changes(state: _State) -> _State:
-        state.code_review_attempts += 1
-
-        suggestions = "\n".join(state.code_review_issues)
-        hints = textwrap.dedent(
-            f"""\
-            Problem statement now includes suggestions from an automated code review.
-            These are possible improvements to the code based on best practices and
-            common patterns.
-
-            Analyse each suggestion carefully. Not all of them need to be applied —
-            use your judgment.
+        # Reviewers often flag the same problem; keep the first report of each.
+        unique_issues = {}
+        for reviewer, issue in state.code_review_issues:
+            unique_issues.setdefault(issue.strip(), reviewer)
 
-            Here is the original issue for context:
-            <original_issue_statement>
-            {state.problem_statement}
-            </original_issue_statement>
-        """
+        suggestions = "\n".join(
+            f"- [{reviewer}] {issue}" for issue, reviewer in unique_issues.items()
         )
-
-        new_state = _State(
-            root_path=state.root_path,
-            problem_statement=f"[Auto Code Review Suggestions]:\n{suggestions}",
-            hints=hints,
-            code_review_attempts=state.code_review_attempts,
+        comment = _CODE_REVIEW_SUGGESTIONS_TMPL.format(suggestions=suggestions)
+        logger.debug(comment)
+
+        # Reuse the state of the finished attempt: the issue and the shared caches
+        # stay, only the results of the attempt are reset. Lists are replaced, not
+        # mutated, as the caller may still hold them.
+        state.issue_comments = [*state.issue_comments, comment]
+        state.issue_statement = prepare_issue_statement(
+            issue_title=state.issue_title,
+            issue_description=state.issue_description,
+            issue_comments=state.issue_comments,
         )
+        state.code_review_attempts += 1
+        state.suggested_code_review_issues = (
+            state.suggested_code_review_issues | unique_issues.keys()
+        )
+        state.code_review_issues = []
+        state.code_context = None
+        state.action_plan = None
+        state.git_diff = None
+
+        return state
 
-        logger.debug(new_state.problem_statement)
 
-        return new_state
+def _review_code_or_end(
+    state: _State,
+) -> Literal[_Node.review_code.__name__, END]:
+    if not state.git_diff or state.git_diff.isspace():
+        logger.warning("Implementation made no changes. Skipping code review.")
+        return END
+
+    return _Node.review_code.__name__
 
 
 def _apply_code_review_suggestions_or_end(
@@ -144,6 +205,11 @@ def _apply_code_review_suggestions_or_end(
         logger.success("No code review suggestions found. Code seems to be ok.")
         return END
 
+    issues = {issue.strip() for _, issue in state.code_review_issues}
+    if issues <= state.suggested_code_review_issues:
+        logger.warning("Code review repeats already suggested issues. Ending loop.")
+        return END
+
     if state.code_review_attempts < AUTOMATED_CODE_REVIEW_MAX_ATTEMPTS:
         logger.debug(
             f"Found `{len(state.code_review_issues)}` issues. "
@@ -163,19 +229,32 @@ class DeepNextGraph(BaseGraph):
 
     def _build(self):
         self.add_quick_node(_Node.gather_project_knowledge)
+        self.add_quick_node(_Node.define_code_context)
         self.add_node(_Node.create_action_plan)
         self.add_node(_Node.implement)
         self.add_node(_Node.review_code)
         self.add_node(_Node.prepare_automated_code_review_changes)
 
+        # Both steps are LLM bound and independent of each other, so run them in
+        # parallel; the action plan waits for both.
         self.add_quick_edge(START, _Node.gather_project_knowledge)
-        self.add_quick_edge(_Node.gather_project_knowledge, _Node.create_action_plan)
+        self.add_quick_edge(START, _Node.define_code_context)
+        self.add_edge(
+            [
+                _Node.gather_project_knowledge.__name__,
+                _Node.define_code_context.__name__,
+            ],
+            _Node.create_action_plan.__name__,
+        )
         self.add_quick_edge(_Node.create_action_plan, _Node.implement)
 
-        self.add_quick_edge(_Node.implement, _Node.review_code)
+        self.add_quick_conditional_edges(_Node.implement, _review_code_or_end)
         self.add_quick_edge(
             _Node.prepare_automated_code_review_changes, _Node.gather_project_knowledge
         )
+        self.add_quick_edge(
+            _Node.prepare_automated_code_review_changes, _Node.define_code_context
+        )
 
         self.add_quick_conditional_edges(
             _Node.review_code, _apply_code_review_suggestions_or_end
@@ -210,23 +289,22 @@ class DeepNextGraph(BaseGraph):
             issue_comments=issue_comments,
         )
         final_state = self.compiled.invoke(initial_state)
-
-        state = _State.model_validate(final_state)
+        action_plan: ActionPlan = final_state["action_plan"]
 
         ordered_steps_str = "\n".join(
             [
                 (
                     f"{idx}. {step.title}\n\n"
                     f"{step.description}\n\n"
-                    f"Target file: `{step.target_file.relative_to(state.root_path)}`\n"
+                    f"Target file: `{step.target_file.relative_to(root)}`\n"
                 )
-                for idx, step in enumerate(state.action_plan.ordered_steps, start=1)
+                for idx, step in enumerate(action_plan.ordered_steps, start=1)
             ]
         )
 
         return DeepNextResult(
-            git_diff=state.git_diff,
-            reasoning=state.action_plan.reasoning,
+            git_diff=final_state["git_diff"],
+            reasoning=action_plan.reasoning,
             action_plan=ordered_steps_str,
         )
 
@@ -1,78 +1,111 @@
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from deep_next.common.common import prepare_issue_statement
 from deep_next.core.base_graph import BaseGraph
+from deep_next.core.common import FileCache
 from deep_next.core.steps.action_plan import action_plan_graph
-from deep_next.core.steps.action_plan.data_model import ActionPlan
+from deep_next.core.steps.action_plan.data_model import ActionPlan, ExistingCodeContext
+from deep_next.core.steps.action_plan.graph import define_code_context
 from deep_next.core.steps.code_review.graph import code_review_graph
+from deep_next.core.steps.gather_project_knowledge.cache import (
+    cache_project_knowledge,
+    project_knowledge_cache_key,
+    read_cached_project_knowledge,
+)
 from deep_next.core.steps.gather_project_knowledge.graph import (
     gather_project_knowledge_graph,
 )
 from deep_next.core.steps.implement.graph import implement_graph
 from langgraph.graph import END, START
-from pydantic import BaseModel, Field
-
-
-class _StateActionPlan(BaseModel):
-
-    root_path: Path = Field(description="Path to the root project directory.")
-    issue_title: str = Field(description="The issue title.")
-    issue_description: str = Field(description="The issue description.")
-    issue_comments: list[str] = Field(
-        default_factory=list, description="Comments made on the issue."
-    )
-
-    project_knowledge: str | None = Field(default=None)
-    action_plan: ActionPlan | None = Field(default=None)
 
-    @property
-    def issue_statement(self) -> str:
-        return prepare_issue_statement(
-            issue_title=self.issue_title,
-            issue_description=self.issue_description,
-            issue_comments=self.issue_comments,
-        )
-
-
-class _StateImplement(BaseModel):
 
-    root_path: Path = Field(description="Path to the root project directory.")
-    issue_title: str = Field(description="The issue title.")
-    issue_description: str = Field(description="The issue description.")
-    issue_comments: list[str] = Field(
-        default_factory=list, description="Comments made on the issue."
-    )
-    action_plan: ActionPlan | None = Field(default=None)
-
-    git_diff: str | None = Field(
-        default=None,
-        description="Final result: git diff of the changes made to the source code.",
-    )
-
-    @property
-    def issue_statement(self) -> str:
-        return prepare_issue_statement(
-            issue_title=self.issue_title,
-            issue_description=self.issue_description,
-            issue_comments=self.issue_comments,
-        )
+@dataclass(slots=True)
+class _StateActionPlan:
+    root_path: Path
+    """Path to the root project directory."""
+    issue_title: str
+    issue_description: str
+    issue_comments: list[str] = field(default_factory=list)
+    """Comments made on the issue."""
+    issue_statement: str | None = None
+    """Issue title, description and comments in one prompt; built once, on creation."""
+
+    project_knowledge: str | None = None
+    code_context: ExistingCodeContext | None = None
+    """Files related to the issue, searched for alongside the project knowledge."""
+    action_plan: ActionPlan | None = None
+
+    file_cache: FileCache = field(default_factory=FileCache)
+    """Cache of file contents shared by all the steps of the run."""
+
+    def __post_init__(self) -> None:
+        if self.issue_statement is None:
+            self.issue_statement = prepare_issue_statement(
+                issue_title=self.issue_title,
+                issue_description=self.issue_description,
+                issue_comments=self.issue_comments,
+            )
+
+
+@dataclass(slots=True)
+class _StateImplement:
+    root_path: Path
+    """Path to the root project directory."""
+    issue_title: str
+    issue_description: str
+    issue_comments: list[str] = field(default_factory=list)
+    """Comments made on the issue."""
+    issue_statement: str | None = None
+    """Issue title, description and comments in one prompt; built once, on creation."""
+    action_plan: ActionPlan | None = None
+
+    git_diff: str | None = None
+    """Final result: git diff of the changes made to the source code."""
+
+    def __post_init__(self) -> None:
+        if self.issue_statement is None:
+            self.issue_statement = prepare_issue_statement(
+                issue_title=self.issue_title,
+                issue_description=self.issue_description,
+                issue_comments=self.issue_comments,
+            )
 
 
 class _NodeActionPlan:
     @staticmethod
     def gather_project_knowledge(state: _StateActionPlan) -> dict:
+        cache_key = project_knowledge_cache_key(state.root_path)
+        project_knowledge = read_cached_project_knowledge(cache_key)
+        if project_knowledge is not None:
+            return {"project_knowledge": project_knowledge}
+
         init_state = gather_project_knowledge_graph.create_init_state(
             root_path=state.root_path,
         )
         final_state = gather_project_knowledge_graph.compiled.invoke(init_state)
+
+        cache_project_knowledge(cache_key, final_state["project_knowledge"])
         return {"project_knowledge": final_state["project_knowledge"]}
 
+    @staticmethod
+    def define_code_context(state: _StateActionPlan) -> dict:
+        code_context = define_code_context(
+            root_path=state.root_path,
+            issue_statement=state.issue_statement,
+            file_cache=state.file_cache,
+        )
+
+        return {"code_context": code_context}
+
     @staticmethod
     def create_action_plan(state: _StateActionPlan) -> dict:
         init_state = action_plan_graph.create_init_state(
             root_path=state.root_path,
             issue_statement=state.issue_statement,
             project_knowledge=state.project_knowledge,
+            file_cache=state.file_cache,
+            code_context=state.code_context,
         )
         final_state = action_plan_graph.compiled.invoke(init_state)
 
@@ -116,11 +149,18 @@ class DeepNextActionPlanGraph(BaseGraph):
 
     def _build(self):
         self.add_quick_node(_NodeActionPlan.gather_project_knowledge)
+        self.add_quick_node(_NodeActionPlan.define_code_context)
         self.add_node(_NodeActionPlan.create_action_plan)
 
+        # Project knowledge and code context are independent; run them in parallel.
         self.add_quick_edge(START, _NodeActionPlan.gather_project_knowledge)
-        self.add_quick_edge(
-            _NodeActionPlan.gather_project_knowledge, _NodeActionPlan.create_action_plan
+        self.add_quick_edge(START, _NodeActionPlan.define_code_context)
+        self.add_edge(
+            [
+                _NodeActionPlan.gather_project_knowledge.__name__,
+                _NodeActionPlan.define_code_context.__name__,
+            ],
+            _NodeActionPlan.create_action_plan.__name__,
         )
         self.add_quick_edge(_NodeActionPlan.create_action_plan, END)
 
@@ -154,7 +194,7 @@ class DeepNextActionPlanGraph(BaseGraph):
         )
         final_state = self.compiled.invoke(initial_state)
 
-        return _StateImplement.model_validate(final_state).action_plan
+        return final_state["action_plan"]
 
 
 class DeepNextImplementGraph(BaseGraph):
@@ -207,7 +247,7 @@ class DeepNextImplementGraph(BaseGraph):
         )
         final_state = self.compiled.invoke(initial_state)
 
-        return _StateImplement.model_validate(final_state).git_diff
+        return final_state["git_diff"]
 
 
 deep_next_action_plan_graph = DeepNextActionPlanGraph()
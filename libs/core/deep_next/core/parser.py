@@ -1,9 +1,21 @@
 import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def _code_block_pattern(code_type: str) -> re.Pattern:
+    return re.compile(rf"```{code_type}\n(.*?)```", flags=re.DOTALL)
+
+
+@lru_cache(maxsize=32)
+def _tag_block_pattern(tag: str) -> re.Pattern:
+    return re.compile(
+        rf"<{re.escape(tag)}>\n(.*?)\n</{re.escape(tag)}>", flags=re.DOTALL
+    )
 
 
 def extract_code_from_block(txt: str, code_type: str = "python") -> str:
-    pattern = rf"```{code_type}\n(.*?)```"
-    match = re.search(pattern, txt, flags=re.DOTALL)
+    match = _code_block_pattern(code_type).search(txt)
     return match.group(1) if match else ""
 
 
@@ -12,17 +24,16 @@ def has_code_block(txt: str, code_type: str = "python") -> bool:
 
 
 def parse_code_block(txt: str, code_type: str = "python") -> str:
-    pattern = rf"```{code_type}\n.*?```"
-    out = re.findall(pattern, txt, flags=re.DOTALL)
-    if len(out) != 1:
+    matches = _code_block_pattern(code_type).finditer(txt)
+    first, second = next(matches, None), next(matches, None)
+    if first is None or second is not None:
         raise Exception("Unexpected no. of code blocks found")
 
-    return out[0]
+    return first.group(0)
 
 
 def extract_from_tag_block(txt: str, tag: str) -> str:
-    pattern = rf"<{re.escape(tag)}>\n(.*?)\n</{re.escape(tag)}>"
-    match = re.search(pattern, txt, flags=re.DOTALL)
+    match = _tag_block_pattern(tag).search(txt)
     return match.group(1) if match else ""
 
 
@@ -31,9 +42,9 @@ def has_tag_block(txt: str, tag: str) -> bool:
 
 
 def parse_tag_block(txt: str, tag: str) -> str:
-    pattern = rf"<{re.escape(tag)}>\n.*?\n</{re.escape(tag)}>"
-    out = re.findall(pattern, txt, flags=re.DOTALL)
-    if len(out) != 1:
+    matches = _tag_block_pattern(tag).finditer(txt)
+    first, second = next(matches, None), next(matches, None)
+    if first is None or second is not None:
         raise Exception("Unexpected no. of code blocks found")
 
-    return out[0]
+    return first.group(0)
@@ -1,4 +1,5 @@
 import functools
+import os
 import re
 import tomllib
 from dataclasses import dataclass
@@ -10,27 +11,28 @@ from deep_next.core.io import read_txt
 from loguru import logger
 
 NOT_FOUND = "<NOT FOUND>"
+_PROJECT_FILES = {
+    "pyproject.toml": "pyproject_toml",
+    "setup.py": "setup_py",
+    "setup.cfg": "setup_cfg",
+}
+_NAME_PATTERN = re.compile(r"name ?= ?(\"|'| )?(?P<name>[\w\-_]+)(\"|'| )?")
 
 
-def find_readme(root_path: Path) -> Path | None:
-    for p in root_path.iterdir():
-        if p.name.startswith("README"):
-            return p
+def find_project_files(root_path: Path) -> dict[str, Path]:
+    """Find the project config files and README in a single directory scan."""
+    files = {}
+    with os.scandir(root_path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
 
+            if field_name := _PROJECT_FILES.get(entry.name):
+                files[field_name] = Path(entry.path)
+            elif entry.name.startswith("README"):
+                files.setdefault("readme", Path(entry.path))
 
-def find_pyproject_toml(root_path: Path) -> Path | None:
-    path = root_path / "pyproject.toml"
-    return path if path.exists() else None
-
-
-def find_setup_py(root_path: Path) -> Path | None:
-    path = root_path / "setup.py"
-    return path if path.exists() else None
-
-
-def find_setup_cfg(root_path: Path) -> Path | None:
-    path = root_path / "setup.cfg"
-    return path if path.exists() else None
+    return files
 
 
 def _log_if_different_than_dir(func):
@@ -58,17 +60,19 @@ class ProjectInfo:
     setup_cfg: str = NOT_FOUND
     readme: str = NOT_FOUND
 
+    @functools.cached_property
+    def _pyproject_dict(self) -> dict[str, Any]:
+        return tomllib.loads(self.pyproject_toml)
+
     def _get_name_from_pyproject_toml_tool(self) -> str | None:
-        pyproject_dict: dict[str, Any] = tomllib.loads(self.pyproject_toml)
         try:
-            return pyproject_dict["tool"]["poetry"]["name"].lower()
+            return self._pyproject_dict["tool"]["poetry"]["name"].lower()
         except KeyError:
             return None
 
     def _get_name_from_pyproject_toml_project(self) -> str | None:
-        pyproject_dict: dict[str, Any] = tomllib.loads(self.pyproject_toml)
         try:
-            return pyproject_dict["project"]["name"].lower()
+            return self._pyproject_dict["project"]["name"].lower()
         except KeyError:
             return None
 
@@ -83,31 +87,35 @@ class ProjectInfo:
                 return result
 
         if self.setup_py != NOT_FOUND:
-            pattern = r"name ?= ?(\"|'| )?(?P<name>[\w\-_]+)(\"|'| )?"
-            match = re.search(pattern, self.setup_py)
+            match = _NAME_PATTERN.search(self.setup_py)
             if match:
                 return match.group("name").lower()
 
         if self.setup_cfg != NOT_FOUND:
-            pattern = r"name ?= ?(\"|'| )?(?P<name>[\w\-_]+)(\"|'| )?"
-            match = re.search(pattern, self.setup_cfg)
+            match = _NAME_PATTERN.search(self.setup_cfg)
             if match:
                 return match.group("name").lower()
 
         raise Exception("Project name not found. This is critical problem.")
 
 
-@lru_cache(maxsize=1)
-def get_project_info(root_dir: Path) -> ProjectInfo:
-    paths = {
-        "pyproject_toml": find_pyproject_toml(root_dir),
-        "setup_py": find_setup_py(root_dir),
-        "setup_cfg": find_setup_cfg(root_dir),
-        "readme": find_readme(root_dir),
-    }
-    data = {name: read_txt(path) for name, path in paths.items() if path}
+@lru_cache(maxsize=32)
+def _read_project_info(
+    root_dir: Path, files: tuple[tuple[str, Path, int], ...]
+) -> ProjectInfo:
+    data = {name: read_txt(path) for name, path, _ in files}
 
     return ProjectInfo(
         root_dir=root_dir,
         **data,
     )
+
+
+def get_project_info(root_dir: Path) -> ProjectInfo:
+    paths = find_project_files(root_dir)
+    # Modification times are part of the cache key, so edited files are reread.
+    files = tuple(
+        (name, path, path.stat().st_mtime_ns) for name, path in sorted(paths.items())
+    )
+
+    return _read_project_info(root_dir, files)
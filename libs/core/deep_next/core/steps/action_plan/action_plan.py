@@ -83,17 +83,9 @@ class _Prompt:
         --------------------
         """  # noqa: E501
     )
-    ai_asks_for_example = textwrap.dedent(
-        """
-        To keep the output quality high, I'd like to confirm that I fully understand the task. \
-        Please provide me the example action plan that will be my guide for better understanding.
-
-        Then I'll right away start working on the action plan for the issue.
-        """  # noqa: E501
-    )
     example_action_plan = textwrap.dedent(
         """
-        Sure! This is example to follow. It was reviewed and approved by the team.
+        This is an example action plan to follow. It was reviewed and approved by the team.
 
         <example_action_plan>
         {example_action_plan}
@@ -102,6 +94,29 @@ class _Prompt:
     )
 
 
+_action_plan_parser = PydanticOutputParser(pydantic_object=ActionPlan)
+
+# Static instructions come first and inputs last, ordered from the least to the
+# most volatile, so providers with prompt caching can reuse the longest prefix.
+_action_plan_prompt = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            _Prompt.role + _Prompt.output_requirements + _Prompt.example_action_plan,
+        ),
+        (
+            "human",
+            _Prompt.project_knowledge
+            + _Prompt.issue_statement
+            + _Prompt.existing_code_snippet,
+        ),
+    ],
+).partial(
+    format_instructions=_action_plan_parser.get_format_instructions(),
+    example_action_plan=example.action_plan.model_dump_json(indent=4),
+)
+
+
 def _validate_paths(action_plan: ActionPlan, root_path: Path) -> ActionPlan:
     """Validates the action plan.
 
@@ -136,6 +151,18 @@ def _validate_paths(action_plan: ActionPlan, root_path: Path) -> ActionPlan:
     retry=retry_if_exception_type((OutputParserException, ActionPlanValidationError)),
     reraise=True,
 )
+def _create_validated_action_plan(
+    root_path: Path, prompt_arguments: dict[str, str]
+) -> ActionPlan:
+    action_plan = (
+        _action_plan_prompt
+        | create_llm(LLMConfigType.ACTION_PLAN, seed=random.randint(1, 100))
+        | _action_plan_parser
+    ).invoke(prompt_arguments)
+
+    return _validate_paths(action_plan, root_path)
+
+
 def create_action_plan(
     root_path: Path,
     issue_statement: str,
@@ -143,33 +170,12 @@ def create_action_plan(
     project_knowledge: str,
 ) -> ActionPlan:
     """Creates structured and dependency-ordered action plan for solving the issue."""
-    parser = PydanticOutputParser(pydantic_object=ActionPlan)
-
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", _Prompt.role),
-            ("human", _Prompt.issue_statement),
-            ("human", _Prompt.project_knowledge),
-            ("human", _Prompt.existing_code_snippet),
-            ("human", _Prompt.output_requirements),
-            ("ai", _Prompt.ai_asks_for_example),
-            ("human", _Prompt.example_action_plan),
-        ],
-    ).partial(
-        format_instructions=parser.get_format_instructions(),
-        example_action_plan=example.action_plan,
-    )
-
-    action_plan = (
-        prompt
-        | create_llm(LLMConfigType.ACTION_PLAN, seed=random.randint(1, 100))
-        | parser
-    ).invoke(
+    # Prompt arguments are prepared once and reused by every retry.
+    return _create_validated_action_plan(
+        root_path,
         {
             "issue_statement": issue_statement,
             "project_knowledge": project_knowledge,
             "existing_code_snippets": existing_code_context.dump(),
-        }
+        },
     )
-
-    return _validate_paths(action_plan, root_path)
@@ -1,8 +1,9 @@
 from pathlib import Path
+from typing import Literal
 
 from deep_next.core.base_graph import BaseGraph
+from deep_next.core.common import FileCache
 from deep_next.core.config import SRFConfig
-from deep_next.core.io import read_txt
 from deep_next.core.steps.action_plan.action_plan import create_action_plan
 from deep_next.core.steps.action_plan.data_model import (
     ActionPlan,
@@ -13,18 +14,27 @@ from deep_next.core.steps.action_plan.srf import srf_graph
 from langchain_core.runnables import RunnableConfig
 from langgraph.constants import START
 from langgraph.graph import END
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class _State(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     # 🔹 Input
     root_path: Path = Field(description="Root path for the project.")
     issue_statement: str = Field(description="Issue details")
     project_knowledge: str = Field(description="Relevant project knowledge.")
 
+    file_cache: FileCache = Field(
+        default_factory=FileCache,
+        exclude=True,
+        description="Cache of file contents shared across the pipeline run.",
+    )
+
     # 🔸 Internal (Hidden)
-    code_context: ExistingCodeContext = Field(
-        default_factory=list, description="Files related to the issue."
+    code_context: ExistingCodeContext | None = Field(
+        default=None,
+        description="Files related to the issue. Searched for if not provided.",
     )
 
     # 🔹 Output
@@ -33,28 +43,41 @@ class _State(BaseModel):
     )
 
 
+def define_code_context(
+    root_path: Path, issue_statement: str, file_cache: FileCache
+) -> ExistingCodeContext:
+    """Find the files related to the issue and read their code."""
+    initial_state = srf_graph.create_init_state(
+        query=issue_statement,
+        root_path=root_path,
+    )
+    final_state = srf_graph.compiled.invoke(
+        initial_state,
+        config=RunnableConfig(recursion_limit=SRFConfig.CYCLE_ITERATION_LIMIT),
+    )
+
+    code_context = [
+        FileCodeContext(
+            path=relevant_file.path,
+            code_snippet=file_cache.read(relevant_file.path),
+            explanation=relevant_file.explanation,
+        )
+        for relevant_file in final_state["final_results"]
+    ]
+
+    return ExistingCodeContext(code_context=code_context)
+
+
 class _Node:
     @staticmethod
     def define_code_context(state: _State) -> dict:
-        initial_state = srf_graph.create_init_state(
-            query=state.issue_statement,
+        code_context = define_code_context(
             root_path=state.root_path,
+            issue_statement=state.issue_statement,
+            file_cache=state.file_cache,
         )
-        final_state = srf_graph.compiled.invoke(
-            initial_state,
-            config=RunnableConfig(recursion_limit=SRFConfig.CYCLE_ITERATION_LIMIT),
-        )
-
-        code_context = [
-            FileCodeContext(
-                path=relevant_file.path,
-                code_snippet=read_txt(relevant_file.path),
-                explanation=relevant_file.explanation,
-            )
-            for relevant_file in final_state["final_results"]
-        ]
 
-        return {"code_context": ExistingCodeContext(code_context=code_context)}
+        return {"code_context": code_context}
 
     @staticmethod
     def create_action_plan(state: _State) -> dict:
@@ -68,6 +91,15 @@ class _Node:
         return {"action_plan": action_plan}
 
 
+def _define_code_context_if_missing(
+    state: _State,
+) -> Literal[_Node.define_code_context.__name__, _Node.create_action_plan.__name__]:
+    if state.code_context is None:
+        return _Node.define_code_context.__name__
+
+    return _Node.create_action_plan.__name__
+
+
 class ActionPlanGraph(BaseGraph):
     def __init__(self):
         super().__init__(_State)
@@ -90,17 +122,24 @@ class ActionPlanGraph(BaseGraph):
         self.add_quick_node(_Node.create_action_plan)
 
         # Edges
-        self.add_quick_edge(START, _Node.define_code_context)
+        self.add_quick_conditional_edges(START, _define_code_context_if_missing)
         self.add_quick_edge(_Node.define_code_context, _Node.create_action_plan)
         self.add_quick_edge(_Node.create_action_plan, END)
 
     def create_init_state(
-        self, root_path: Path, issue_statement: str, project_knowledge: str
+        self,
+        root_path: Path,
+        issue_statement: str,
+        project_knowledge: str,
+        file_cache: FileCache | None = None,
+        code_context: ExistingCodeContext | None = None,
     ) -> _State:
         return _State(
             root_path=root_path,
             issue_statement=issue_statement,
             project_knowledge=project_knowledge,
+            file_cache=file_cache or FileCache(),
+            code_context=code_context,
         )
 
 
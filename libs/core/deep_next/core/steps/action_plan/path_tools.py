@@ -1,5 +1,7 @@
+import os
 from pathlib import Path
 
+from deep_next.core.config import SRF_INDEXER_IGNORE_DIR_PREFIXES
 from loguru import logger
 
 
@@ -31,6 +33,26 @@ def _resolve_path(path: Path, abs_dir_path: Path) -> Path | None:
     return None
 
 
+def _find_unique_file(file_name: str, abs_dir_path: Path) -> Path | None:
+    """Finds the file with given name if it's the only one in the project tree.
+
+    Ignored dirs (venvs, `.git`, caches, ...) are skipped, as for the SRF index.
+    """
+    matches = []
+    for dir_path, dir_names, file_names in os.walk(abs_dir_path):
+        dir_names[:] = [
+            name
+            for name in dir_names
+            if not name.startswith(SRF_INDEXER_IGNORE_DIR_PREFIXES)
+        ]
+        if file_name in file_names:
+            matches.append(Path(dir_path) / file_name)
+            if len(matches) > 1:
+                return None
+
+    return matches[0].resolve() if matches else None
+
+
 def try_to_resolve_path(path: Path, abs_dir_path: Path) -> Path:
     """If it's a mistake or is it a new file? Try to resolve the path.
 
@@ -51,6 +73,11 @@ def try_to_resolve_path(path: Path, abs_dir_path: Path) -> Path:
         logger.info(f"It's a new file. Resolved to '{str(resolved)}'")
         return resolved / file_name
 
+    # Cheaper than asking the LLM for a new action plan over a mistyped directory.
+    if resolved := _find_unique_file(file_name, abs_dir_path):
+        logger.info(f"It's the only file named '{file_name}'. Resolved to '{resolved}'")
+        return resolved
+
     raise FileNotFoundError(
         f"Invalid path. Failed to resolve '{str(path)}' with respect to "
         f"'{str(abs_dir_path)}' automatically"
@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 
 from deep_next.core.steps.action_plan.srf.file_selection.tools.list_file_structure import (  # noqa: E501
@@ -28,12 +29,31 @@ from langgraph.prebuilt import ToolNode
 _llm_tools: dict[Path, list] = {}
 _tool_nodes: dict[Path, ToolNode] = {}
 
+# Graphs searching the same repo may run concurrently, so the tools are shared and
+# disposed of when the last user is done.
+_tools_users: dict[Path, int] = {}
+_tools_lock = threading.Lock()
+
 
 def init_tools(root_path: Path):
-    init_acr_backend(root_path)
-    llm_tools = build_llm_tools(root_path)
-    _llm_tools[root_path] = llm_tools
-    _tool_nodes[root_path] = ToolNode(llm_tools, messages_key="_messages")
+    with _tools_lock:
+        if root_path in _tools_users:
+            _tools_users[root_path] += 1
+            return
+
+        # Registered as a user only once the tools exist, so a failed init is retried
+        # by the next user.
+        init_acr_backend(root_path)
+        try:
+            llm_tools = build_llm_tools(root_path)
+            tool_node = ToolNode(llm_tools, messages_key="_messages")
+        except BaseException:
+            dispose_acr_backend(root_path)
+            raise
+
+        _llm_tools[root_path] = llm_tools
+        _tool_nodes[root_path] = tool_node
+        _tools_users[root_path] = 1
 
 
 def get_llm_tools(root_path: Path):
@@ -45,9 +65,15 @@ def get_tool_node(root_path: Path):
 
 
 def dispose_tools(root_path: Path):
-    dispose_acr_backend(root_path)
-    del _llm_tools[root_path]
-    del _tool_nodes[root_path]
+    with _tools_lock:
+        _tools_users[root_path] -= 1
+        if _tools_users[root_path]:
+            return
+
+        del _tools_users[root_path]
+        dispose_acr_backend(root_path)
+        del _llm_tools[root_path]
+        del _tool_nodes[root_path]
 
 
 def build_llm_tools(root_path: Path) -> list:
@@ -1,10 +1,10 @@
 from pathlib import Path
 
 from deep_next.core.base_graph import BaseGraph
-from deep_next.core.io import read_txt
+from deep_next.core.common import FileCache
 from deep_next.core.steps.code_review.review_code import review_code as _review_code
 from langgraph.graph import END, START
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from unidiff import PatchSet
 
 
@@ -21,6 +21,8 @@ class CodeReviewResult(BaseModel):
 
 
 class _State(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     # Input
     root_path: Path = Field(description="Path to the root project directory.")
     issue_statement: str = Field(description="The issue title and body.")
@@ -34,6 +36,12 @@ class _State(BaseModel):
         default=True,
     )
 
+    file_cache: FileCache = Field(
+        default_factory=FileCache,
+        exclude=True,
+        description="Cache of file contents shared across the pipeline run.",
+    )
+
     code_fragments: dict[str, list[str]] = Field(
         default_factory=dict,
         description="Code fragments selected from the files in the git diff.",
@@ -65,7 +73,8 @@ class _Node:
 
         return {
             "code_fragments": {
-                str(path): [read_txt(path)] for path in modified_files_paths
+                str(path): [state.file_cache.read(path)]
+                for path in modified_files_paths
             }
         }
 
@@ -108,6 +117,7 @@ class CodeReviewGraph(BaseGraph):
         project_knowledge: str,
         git_diff: str,
         include_code_fragments: bool = True,
+        file_cache: FileCache | None = None,
     ) -> _State:
         return _State(
             root_path=root_path,
@@ -115,6 +125,7 @@ class CodeReviewGraph(BaseGraph):
             project_knowledge=project_knowledge,
             git_diff=git_diff,
             include_code_fragments=include_code_fragments,
+            file_cache=file_cache or FileCache(),
         )
 
     def __call__(
@@ -133,9 +144,9 @@ class CodeReviewGraph(BaseGraph):
             include_code_fragments,
         )
         final_state = self.compiled.invoke(initial_state)
-        final_state = _State.model_validate(final_state)
 
-        return final_state.result
+        # Only the result is returned, so only the result is validated.
+        return CodeReviewResult.model_validate(final_state["result"])
 
 
 code_review_graph = CodeReviewGraph()
@@ -1,9 +1,10 @@
 import json
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 
 from deep_next.common.llm import LLMConfigType, create_llm
 from deep_next.core import parser
-from deep_next.core.steps.code_review.model.base import CodeReviewModel
+from deep_next.core.steps.code_review.model.base import CodeReviewer, CodeReviewModel
 from deep_next.core.steps.code_review.model.code_style import code_style_code_reviewer
 from deep_next.core.steps.code_review.model.diff_consistency import (
     diff_consistency_code_reviewer,
@@ -186,6 +187,30 @@ def _combine_code_fragments(code_fragments: dict[str, list[str]]) -> dict[str, s
     }
 
 
+def _run_code_reviewer(
+    code_reviewer: CodeReviewer,
+    issue_statement: str,
+    project_knowledge: str,
+    git_diff: str,
+    combined_code_fragments: dict[str, str],
+) -> CodeReviewModel | None:
+    try:
+        return _call_code_review_llm(
+            issue_statement,
+            project_knowledge,
+            git_diff,
+            combined_code_fragments,
+            example_output=code_reviewer.example_output,
+            code_review_parser=code_reviewer.parser,
+        )
+    except Exception as e:
+        logger.warning(
+            f"Code reviewer {code_reviewer.name} failed to review the code. "
+            f"Exception:\n{e}"
+        )
+        return None
+
+
 def review_code(
     issue_statement: str,
     project_knowledge: str,
@@ -195,27 +220,27 @@ def review_code(
     issues = []
 
     all_code_reviewers = [diff_consistency_code_reviewer, code_style_code_reviewer]
-
-    code_review_completed = {
-        code_reviewer.name: True for code_reviewer in all_code_reviewers
-    }
-
-    for code_reviewer in all_code_reviewers:
-        try:
-            code_review = _call_code_review_llm(
-                issue_statement,
-                project_knowledge,
-                git_diff,
-                _combine_code_fragments(code_fragments),
-                example_output=code_reviewer.example_output,
-                code_review_parser=code_reviewer.parser,
+    combined_code_fragments = _combine_code_fragments(code_fragments)
+
+    # Reviewers are independent LLM calls, so wait for them all at once.
+    with ThreadPoolExecutor(max_workers=len(all_code_reviewers)) as executor:
+        code_reviews = list(
+            executor.map(
+                lambda code_reviewer: _run_code_reviewer(
+                    code_reviewer,
+                    issue_statement,
+                    project_knowledge,
+                    git_diff,
+                    combined_code_fragments,
+                ),
+                all_code_reviewers,
             )
+        )
+
+    code_review_completed = {}
+    for code_reviewer, code_review in zip(all_code_reviewers, code_reviews):
+        code_review_completed[code_reviewer.name] = code_review is not None
+        if code_review is not None:
             issues.extend([(code_reviewer.name, issue) for issue in code_review.issues])
-        except Exception as e:
-            logger.warning(
-                f"Code reviewer {code_reviewer.name} failed to review the code. "
-                f"Exception:\n{e}"
-            )
-            code_review_completed[code_reviewer.name] = False
 
     return issues, code_review_completed
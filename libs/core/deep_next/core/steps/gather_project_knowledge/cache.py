@@ -0,0 +1,111 @@
+import hashlib
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+from deep_next.common.llm import LLMConfig, LLMConfigType
+from deep_next.core.config import DATA_DIR, SRF_INDEXER_IGNORE_DIR_PREFIXES
+from loguru import logger
+
+# The project knowledge is gathered once per project content (the git commit plus any
+# uncommitted changes) and LLM setup. Projects outside git aren't cached.
+_CACHE_DIR = DATA_DIR / "project_knowledge"
+_MAX_CACHE_ENTRIES = 32
+
+# Bump on changes to the project knowledge prompts, so knowledge gathered with the
+# previous ones isn't reused.
+_CACHE_VERSION = 1
+
+
+def _git(root_path: Path, *args: str) -> bytes | None:
+    resp = subprocess.run(
+        ["git", *args],
+        cwd=root_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    return resp.stdout.strip() if resp.returncode == 0 else None
+
+
+def _content_key(root_path: Path) -> str | None:
+    status = _git(root_path, "status", "--porcelain")
+    head = _git(root_path, "rev-parse", "HEAD")
+    if status is None or head is None:
+        return None
+
+    digest = hashlib.blake2b(digest_size=16)
+    # The project description is generated with the action plan LLM.
+    llm_config = LLMConfig.load(LLMConfigType.ACTION_PLAN)
+    digest.update(f"{_CACHE_VERSION}\0{llm_config.model_dump_json()}\0".encode())
+    # Relative to the repo root, so clones of the same repo share the cache.
+    for part in [head, _git(root_path, "rev-parse", "--show-prefix") or b""]:
+        digest.update(part + b"\0")
+    for prefix in SRF_INDEXER_IGNORE_DIR_PREFIXES:
+        digest.update(prefix.encode() + b"\0")
+
+    if status:
+        # Uncommitted changes: tracked ones via the diff, untracked files by their
+        # stat, so large artifacts aren't read.
+        digest.update(_git(root_path, "diff", "HEAD", "--binary") or b"")
+        untracked = _git(root_path, "ls-files", "--others", "--exclude-standard", "-z")
+        for file_path in filter(None, (untracked or b"").split(b"\0")):
+            stat = os.lstat(root_path / os.fsdecode(file_path))
+            digest.update(
+                file_path + f"\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode()
+            )
+
+    return digest.hexdigest()
+
+
+def project_knowledge_cache_key(root_path: Path) -> str | None:
+    """Key of the project content, `None` if it can't be cached.
+
+    Compute it once, before gathering the knowledge, and use it for both reading and
+    writing the cache, so the result is stored for the content it was gathered from.
+    """
+    try:
+        return _content_key(Path(root_path))
+    except Exception as e:
+        logger.warning(f"Project knowledge won't be cached: {e!r}")
+        return None
+
+
+def _evict_old_entries() -> None:
+    entries = sorted(
+        _CACHE_DIR.glob("pk_*.txt"), key=lambda path: path.stat().st_mtime_ns
+    )
+    for path in entries[:-_MAX_CACHE_ENTRIES]:
+        path.unlink(missing_ok=True)
+
+
+def read_cached_project_knowledge(cache_key: str | None) -> str | None:
+    """Return the project knowledge cached under the given key, if any."""
+    if cache_key is None:
+        return None
+
+    path = _CACHE_DIR / f"pk_{cache_key}.txt"
+    try:
+        project_knowledge = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+    # Mark as recently used, so it's the last to be evicted.
+    path.touch()
+    logger.info(f"Using cached project knowledge: '{path}'")
+    return project_knowledge
+
+
+def cache_project_knowledge(cache_key: str | None, project_knowledge: str) -> None:
+    """Cache the project knowledge under the given key."""
+    if cache_key is None:
+        return
+
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=_CACHE_DIR, suffix=".tmp", delete=False
+    ) as f:
+        f.write(project_knowledge)
+    Path(f.name).replace(_CACHE_DIR / f"pk_{cache_key}.txt")
+
+    _evict_old_entries()
@@ -90,9 +90,9 @@ class GatherProjectKnowledgeGraph(BaseGraph):
 
     def __call__(self, root_path: Path) -> str:
         init_state = self.create_init_state(root_path)
-        state: _State = self.compiled.invoke(init_state)
+        final_state = self.compiled.invoke(init_state)
 
-        return _State.model_validate(state).project_knowledge
+        return final_state["project_knowledge"]
 
 
 gather_project_knowledge_graph = GatherProjectKnowledgeGraph()
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import List
 
 from deep_next.common.llm import LLMConfigType, create_llm
-from deep_next.core.io import read_txt
+from deep_next.core.common import FileCache
 from deep_next.core.parser import has_tag_block, parse_tag_block
 from deep_next.core.steps.action_plan.data_model import Step
 from deep_next.core.steps.implement import acr
@@ -48,17 +48,20 @@ class ParsePatchesError(Exception):
     """Raised for issues encountered during parse patches process."""
 
 
-def develop_single_file_patches(step: Step, issue_statement: str, git_diff: str) -> str:
+def develop_single_file_patches(
+    step: Step, issue_statement: str, git_diff: str, file_cache: FileCache
+) -> str:
     if not step.target_file.exists():
         logger.warning(f"Creating new file: '{step.target_file}'")
 
         with open(step.target_file, "w") as f:
             f.write("# Comment added at creation time to indicate empty file.\n")
+        file_cache.invalidate(step.target_file)
 
     raw_edits = _create_llm_agent(PromptSingleFileImplementation).invoke(
         {
             "path": step.target_file,
-            "code_context": read_txt(step.target_file),
+            "code_context": file_cache.read(step.target_file),
             "high_level_description": step.title,
             "description": step.description,
             "issue_statement": issue_statement,
@@ -69,12 +72,15 @@ def develop_single_file_patches(step: Step, issue_statement: str, git_diff: str)
     return raw_edits
 
 
-def develop_all_patches(steps: List[Step], issue_statement: str) -> str:
+def develop_all_patches(
+    steps: List[Step], issue_statement: str, file_cache: FileCache
+) -> str:
     """Develop patches for all steps in a single run.
 
     Args:
         steps: List of steps to implement
         issue_statement: The issue statement
+        file_cache: Cache used to read the target files
 
     Returns:
         The combined raw patches text for all files
@@ -86,6 +92,7 @@ def develop_all_patches(steps: List[Step], issue_statement: str) -> str:
             logger.warning(f"Creating new file: '{step.target_file}'")
             with open(step.target_file, "w") as f:
                 f.write("# Comment added at creation time to indicate empty file.\n")
+            file_cache.invalidate(step.target_file)
 
     steps_description = "\n".join(
         [
@@ -96,18 +103,19 @@ def develop_all_patches(steps: List[Step], issue_statement: str) -> str:
         ]
     )
 
-    files_content = ""
+    file_blocks = []
     for step in steps:
         markdown_style = "python" if step.target_file.suffix == ".py" else "txt"
         try:
-            file_content = read_txt(step.target_file)
+            file_content = file_cache.read(step.target_file)
         except Exception as e:
             logger.warning(f"Failed to read file {step.target_file}: {e}")
             file_content = ""
-        files_content += (
+        file_blocks.append(
             f"\nFile: {step.target_file}\n"
             f"```{markdown_style}\n{file_content}\n```\n"
         )
+    files_content = "".join(file_blocks)
 
     raw_modifications = _create_llm_agent(PromptAllAtOnceImplementation).invoke(
         {
@@ -180,10 +188,13 @@ def parse_patches(txt: str) -> list[CodePatch]:
     ]
 
 
-def parse_and_apply_patches(raw_patches: str) -> None:
+def parse_and_apply_patches(raw_patches: str, file_cache: FileCache) -> None:
     """Parse and apply patches to the codebase."""
     patches: list[CodePatch] = parse_patches(raw_patches)
     patches = [patch for patch in patches if patch.before != patch.after]
 
     for patch in patches:
-        apply_patch(patch)
+        try:
+            apply_patch(patch)
+        finally:
+            file_cache.invalidate(patch.file_path)
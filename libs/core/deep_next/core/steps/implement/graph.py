@@ -4,6 +4,7 @@ from typing import Literal
 
 import tenacity
 from deep_next.core.base_graph import BaseGraph
+from deep_next.core.common import FileCache
 from deep_next.core.config import IMPLEMENTATION_MODE, ImplementationModes
 from deep_next.core.steps.action_plan.data_model import ActionPlan, Step
 from deep_next.core.steps.implement.apply_patch.common import ApplyPatchError
@@ -16,10 +17,12 @@ from deep_next.core.steps.implement.develop_patch import (
 from deep_next.core.steps.implement.git_diff import generate_diff
 from langgraph.graph import END, START
 from loguru import logger
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class _State(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     root_path: Path = Field(description="Path to the root project directory.")
     issue_statement: str = Field(
         description="Detailed description of the issue to be implemented."
@@ -38,6 +41,12 @@ class _State(BaseModel):
         description="The resulting git diff after applying the implementation steps.",
     )
 
+    file_cache: FileCache = Field(
+        default_factory=FileCache,
+        exclude=True,
+        description="Cache of file contents shared across the pipeline run.",
+    )
+
     @model_validator(mode="after")
     def initialize_steps_remaining(self) -> "_State":
         if self.steps_remaining is None:
@@ -71,12 +80,13 @@ class _Node:
         raw_patches = develop_single_file_patches(
             step=state.selected_step,
             issue_statement=state.issue_statement,
+            file_cache=state.file_cache,
             git_diff=(
                 generate_diff(state.root_path)
                 or "<Empty Git Diff, no modifications found>"
             ),
         )
-        parse_and_apply_patches(raw_patches=raw_patches)
+        parse_and_apply_patches(raw_patches=raw_patches, file_cache=state.file_cache)
         return state
 
     @staticmethod
@@ -94,9 +104,11 @@ class _Node:
     ) -> _State:
         """Develop all patches for all steps at once."""
         raw_patches = develop_all_patches(
-            steps=state.steps, issue_statement=state.issue_statement
+            steps=state.steps,
+            issue_statement=state.issue_statement,
+            file_cache=state.file_cache,
         )
-        parse_and_apply_patches(raw_patches=raw_patches)
+        parse_and_apply_patches(raw_patches=raw_patches, file_cache=state.file_cache)
 
         # Empty the steps_remaining list since we've processed all steps at once
         state.steps_remaining = []
@@ -151,21 +163,26 @@ class ImplementGraph(BaseGraph):
         self.add_quick_edge(_Node.generate_git_diff, END)
 
     def create_init_state(
-        self, root_path: Path, issue_statement: str, action_plan: ActionPlan
+        self,
+        root_path: Path,
+        issue_statement: str,
+        action_plan: ActionPlan,
+        file_cache: FileCache | None = None,
     ) -> _State:
         return _State(
             root_path=root_path,
             issue_statement=issue_statement,
             steps=action_plan.ordered_steps,
+            file_cache=file_cache or FileCache(),
         )
 
     def __call__(
         self, root_path: Path, issue_statement: str, action_plan: ActionPlan
     ) -> str:
         initial_state = self.create_init_state(root_path, issue_statement, action_plan)
-        final_state: _State = self.compiled.invoke(initial_state)
+        final_state = self.compiled.invoke(initial_state)
 
-        return _State.model_validate(final_state).git_diff
+        return final_state["git_diff"]
 
 
 implement_graph = ImplementGraph()
@@ -0,0 +1,109 @@
+import os
+from pathlib import Path
+
+import pytest
+from deep_next.core.common import FileCache, RemoveThinkingBlocksParser, dump_filepaths
+
+
+@pytest.mark.parametrize(
+    "txt, expected",
+    [
+        ("Answer", "Answer"),
+        ("  Answer\n", "Answer"),
+        ("<think>Reasoning</think>Answer", "Answer"),
+        ("<think>\nMulti\nline\n</think>\n\nAnswer", "Answer"),
+        ("<think>a</think>Answer<think>b</think> text", "Answer text"),
+        ("<think>Unclosed reasoning\nAnswer", "<think>Unclosed reasoning\nAnswer"),
+        ("<think>a < b <thinking> </thin></think>Answer", "Answer"),
+    ],
+)
+def test_remove_thinking_blocks_parser(txt: str, expected: str) -> None:
+    assert RemoveThinkingBlocksParser().parse(txt) == expected
+
+
+def test_dump_filepaths(tmp_path: Path) -> None:
+    tmp_path = tmp_path.resolve()
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.py").write_text("b = 2")
+
+    dump = dump_filepaths([tmp_path / "a.py", str(tmp_path / "b.py")], FileCache())
+
+    assert dump == (
+        f"\nPath: {tmp_path / 'a.py'}\n```python\na = 1\n\n```\n"
+        "\n"
+        f"\nPath: {tmp_path / 'b.py'}\n```python\nb = 2\n```\n"
+    )
+
+
+def test_dump_filepaths_picks_up_file_changes(tmp_path: Path) -> None:
+    file_path = tmp_path / "a.py"
+
+    file_cache = FileCache()
+
+    file_path.write_text("a = 1")
+    assert "a = 1" in dump_filepaths([file_path], file_cache)
+
+    file_path.write_text("a = 22")
+    assert "a = 22" in dump_filepaths([file_path], file_cache)
+
+
+def test_dump_filepaths_without_files() -> None:
+    assert dump_filepaths([], FileCache()) == ""
+
+
+def test_dump_filepaths_normalizes_newlines(tmp_path: Path) -> None:
+    file_path = tmp_path / "a.py"
+    file_path.write_bytes(b"a = 1\r\nb = 2\rc = 3\n")
+
+    assert "a = 1\nb = 2\nc = 3\n" in dump_filepaths([file_path], FileCache())
+
+
+def test_file_cache_read(tmp_path: Path) -> None:
+    file_path = tmp_path / "a.py"
+    file_cache = FileCache()
+
+    file_path.write_text("a = 1\r\n")
+    assert file_cache.read(file_path) == "a = 1\n"
+
+    file_path.write_text("a = 22\n")
+    assert file_cache.read(str(file_path)) == "a = 22\n"
+    assert "a = 22" in dump_filepaths([file_path], file_cache=file_cache)
+
+
+def test_file_cache_resolves_relative_paths_from_cwd(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_cache = FileCache()
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "x.py").write_text(f"{name} = 1\n")
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert file_cache.read("x.py") == "a = 1\n"
+
+    monkeypatch.chdir(tmp_path / "b")
+    assert file_cache.read("x.py") == "b = 1\n"
+
+
+def test_file_cache_rereads_same_size_write_within_mtime_tick(tmp_path: Path) -> None:
+    file_path = tmp_path / "a.py"
+    file_cache = FileCache()
+
+    file_path.write_text("a = 1\n")
+    stat = file_path.stat()
+    assert file_cache.read(file_path) == "a = 1\n"
+
+    file_path.write_text("a = 2\n")
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert file_cache.read(file_path) == "a = 2\n"
+
+
+def test_file_cache_invalidate(tmp_path: Path) -> None:
+    file_path = tmp_path / "a.py"
+    file_cache = FileCache()
+
+    file_path.write_text("a = 1\n")
+    assert file_cache.read(file_path) == "a = 1\n"
+
+    file_cache.invalidate(file_path)
+    assert not file_cache._entries
@@ -0,0 +1,147 @@
+from pathlib import Path
+
+import pytest
+from deep_next.core import graph, graph_hitl
+from deep_next.core.steps.action_plan.data_model import ActionPlan, ExistingCodeContext
+
+
+class _FakeSubgraph:
+    """Stands in for a compiled subgraph, returning canned final states."""
+
+    def __init__(self, *final_states: dict):
+        self._final_states = list(final_states)
+        self.init_states: list[dict] = []
+        self.compiled = self
+
+    def create_init_state(self, **kwargs) -> dict:
+        return kwargs
+
+    def invoke(self, init_state: dict, **_) -> dict:
+        self.init_states.append(init_state)
+        return (
+            self._final_states.pop(0)
+            if len(self._final_states) > 1
+            else self._final_states[0]
+        )
+
+
+@pytest.fixture
+def code_review(monkeypatch: pytest.MonkeyPatch) -> _FakeSubgraph:
+    action_plan = ActionPlan(reasoning="Reasoning", ordered_steps=[])
+    code_review = _FakeSubgraph(
+        {"result": {"issues": [("reviewer", "Rename `x`.")]}},
+        {"result": {"issues": []}},
+    )
+
+    monkeypatch.setattr(graph, "project_knowledge_cache_key", lambda _: None)
+    monkeypatch.setattr(graph, "read_cached_project_knowledge", lambda _: None)
+    monkeypatch.setattr(graph, "cache_project_knowledge", lambda *_: None)
+    monkeypatch.setattr(
+        graph,
+        "gather_project_knowledge_graph",
+        _FakeSubgraph({"project_knowledge": "Knowledge"}),
+    )
+    monkeypatch.setattr(graph, "define_code_context", lambda **_: ExistingCodeContext())
+    monkeypatch.setattr(
+        graph, "action_plan_graph", _FakeSubgraph({"action_plan": action_plan})
+    )
+    monkeypatch.setattr(graph, "implement_graph", _FakeSubgraph({"git_diff": "diff"}))
+    monkeypatch.setattr(graph, "code_review_graph", code_review)
+    monkeypatch.setattr(graph, "AUTOMATED_CODE_REVIEW_MAX_ATTEMPTS", 1)
+
+    return code_review
+
+
+def test_code_review_suggestions_are_retried_as_issue_comment(
+    code_review: _FakeSubgraph,
+) -> None:
+    issue_comments = ["Comment"]
+
+    result = graph.deep_next_graph(
+        issue_title="Title",
+        issue_description="Description",
+        issue_comments=issue_comments,
+        root=Path("."),
+    )
+
+    assert result.git_diff == "diff"
+    assert len(code_review.init_states) == 2
+
+    first_statement, retry_statement = (
+        init_state["issue_statement"] for init_state in code_review.init_states
+    )
+    assert "Rename `x`." not in first_statement
+    assert "- [reviewer] Rename `x`." in retry_statement
+    assert issue_comments == ["Comment"]
+
+
+def test_code_review_skipped_without_changes(
+    code_review: _FakeSubgraph, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(graph, "implement_graph", _FakeSubgraph({"git_diff": "\n"}))
+
+    result = graph.deep_next_graph(
+        issue_title="Title", issue_description="Description", root=Path(".")
+    )
+
+    assert result.git_diff == "\n"
+    assert not code_review.init_states
+
+
+def test_duplicate_code_review_issues_are_suggested_once() -> None:
+    state = graph._State(
+        root_path=Path("."),
+        issue_title="Title",
+        issue_description="Description",
+        code_review_issues=[
+            ("reviewer_a", "Rename `x`."),
+            ("reviewer_b", "Rename `x`. "),
+            ("reviewer_b", "Add a test."),
+        ],
+    )
+
+    state = graph._Node.prepare_automated_code_review_changes(state)
+
+    assert state.issue_comments[-1].count("Rename `x`.") == 1
+    assert "- [reviewer_a] Rename `x`." in state.issue_comments[-1]
+    assert "- [reviewer_b] Add a test." in state.issue_comments[-1]
+
+
+def test_code_review_loop_ends_on_repeated_issues(
+    code_review: _FakeSubgraph, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(graph, "AUTOMATED_CODE_REVIEW_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(
+        graph,
+        "code_review_graph",
+        _FakeSubgraph({"result": {"issues": [("reviewer", "Rename `x`.")]}}),
+    )
+
+    graph.deep_next_graph(
+        issue_title="Title", issue_description="Description", root=Path(".")
+    )
+
+    assert len(graph.code_review_graph.init_states) == 2
+
+
+def test_hitl_action_plan_uses_code_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    action_plan = ActionPlan(reasoning="Reasoning", ordered_steps=[])
+    code_context = ExistingCodeContext()
+    action_plan_graph = _FakeSubgraph({"action_plan": action_plan})
+
+    monkeypatch.setattr(graph_hitl, "project_knowledge_cache_key", lambda _: "key")
+    monkeypatch.setattr(graph_hitl, "read_cached_project_knowledge", lambda _: "PK")
+    monkeypatch.setattr(graph_hitl, "define_code_context", lambda **_: code_context)
+    monkeypatch.setattr(graph_hitl, "action_plan_graph", action_plan_graph)
+
+    result = graph_hitl.deep_next_action_plan_graph(
+        root_path=Path("."),
+        issue_title="Title",
+        issue_description="Description",
+        issue_comments=[],
+    )
+
+    assert result is action_plan
+    (init_state,) = action_plan_graph.init_states
+    assert init_state["project_knowledge"] == "PK"
+    assert init_state["code_context"] is code_context
@@ -0,0 +1,30 @@
+import os
+from pathlib import Path
+
+from deep_next.core.project_info import find_project_files, get_project_info
+
+
+def test_get_project_info_rereads_modified_files(tmp_path: Path) -> None:
+    pyproject_toml = tmp_path / "pyproject.toml"
+    pyproject_toml.write_text('[project]\nname = "old"\n')
+
+    assert get_project_info(tmp_path) is get_project_info(tmp_path)
+    assert get_project_info(tmp_path).name == "old"
+
+    pyproject_toml.write_text('[project]\nname = "new"\n')
+    stat = pyproject_toml.stat()
+    os.utime(pyproject_toml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert get_project_info(tmp_path).name == "new"
+
+
+def test_find_project_files(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").touch()
+    (tmp_path / "README.md").touch()
+    (tmp_path / "README_assets").mkdir()
+    (tmp_path / "main.py").touch()
+
+    assert find_project_files(tmp_path) == {
+        "pyproject_toml": tmp_path / "pyproject.toml",
+        "readme": tmp_path / "README.md",
+    }
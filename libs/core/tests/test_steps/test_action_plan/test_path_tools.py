@@ -1,7 +1,10 @@
 from pathlib import Path
 
 import pytest
-from deep_next.core.steps.action_plan.path_tools import _resolve_path
+from deep_next.core.steps.action_plan.path_tools import (
+    _resolve_path,
+    try_to_resolve_path,
+)
 from tests.utils import EXAMPLE_REPO_ROOT_DIR, EXAMPLE_REPO_SRC_PATH
 
 
@@ -33,3 +36,37 @@ from tests.utils import EXAMPLE_REPO_ROOT_DIR, EXAMPLE_REPO_SRC_PATH
 )
 def test_resolve_path(filepath: str, dir_path: Path, expected):
     assert _resolve_path(Path(filepath), dir_path) == expected
+
+
+def test_try_to_resolve_path_to_only_file_with_name() -> None:
+    assert (
+        try_to_resolve_path(Path("wrong/dir/model.py"), EXAMPLE_REPO_ROOT_DIR)
+        == EXAMPLE_REPO_SRC_PATH / "model.py"
+    )
+
+
+def test_try_to_resolve_path_with_ambiguous_name(tmp_path: Path) -> None:
+    for dir_name in ("a", "b"):
+        (tmp_path / dir_name).mkdir()
+        (tmp_path / dir_name / "model.py").touch()
+
+    with pytest.raises(FileNotFoundError):
+        try_to_resolve_path(Path("wrong/dir/model.py"), tmp_path)
+
+
+def test_try_to_resolve_path_skips_ignored_dirs(tmp_path: Path) -> None:
+    for dir_name in ("src", ".venv/lib"):
+        (tmp_path / dir_name).mkdir(parents=True)
+        (tmp_path / dir_name / "model.py").touch()
+
+    assert (
+        try_to_resolve_path(Path("wrong/dir/model.py"), tmp_path)
+        == (tmp_path / "src" / "model.py").resolve()
+    )
+
+
+def test_try_to_resolve_path_ignores_dirs_with_file_name(tmp_path: Path) -> None:
+    (tmp_path / "src" / "model.py").mkdir(parents=True)
+
+    with pytest.raises(FileNotFoundError):
+        try_to_resolve_path(Path("wrong/dir/model.py"), tmp_path)
@@ -0,0 +1,42 @@
+import pytest
+from deep_next.core import config
+from deep_next.core.steps.action_plan.srf.file_selection.tools import tools
+from deep_next.core.steps.action_plan.srf.file_selection.tools.tools import (
+    dispose_tools,
+    get_llm_tools,
+    init_tools,
+)
+
+EXAMPLE_MODULE_PATH = config.ROOT_DIR / "tests" / "_resources" / "example_project"
+
+
+def test_tools_are_shared_until_last_user_disposes_them() -> None:
+    init_tools(EXAMPLE_MODULE_PATH)
+    llm_tools = get_llm_tools(EXAMPLE_MODULE_PATH)
+
+    init_tools(EXAMPLE_MODULE_PATH)
+    assert get_llm_tools(EXAMPLE_MODULE_PATH) is llm_tools
+
+    dispose_tools(EXAMPLE_MODULE_PATH)
+    assert get_llm_tools(EXAMPLE_MODULE_PATH) is llm_tools
+
+    dispose_tools(EXAMPLE_MODULE_PATH)
+    with pytest.raises(KeyError):
+        get_llm_tools(EXAMPLE_MODULE_PATH)
+
+
+def test_failed_tools_init_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail(_) -> list:
+        raise RuntimeError()
+
+    with monkeypatch.context() as m:
+        m.setattr(tools, "build_llm_tools", _fail)
+        with pytest.raises(RuntimeError):
+            init_tools(EXAMPLE_MODULE_PATH)
+
+    init_tools(EXAMPLE_MODULE_PATH)
+    assert get_llm_tools(EXAMPLE_MODULE_PATH)
+
+    dispose_tools(EXAMPLE_MODULE_PATH)
+    with pytest.raises(KeyError):
+        get_llm_tools(EXAMPLE_MODULE_PATH)
@@ -0,0 +1,109 @@
+import os
+from pathlib import Path
+
+import pytest
+from deep_next.common.llm import LLMConfig, LLMConfigType
+from deep_next.common.utils.fs import tmp_git_dir
+from deep_next.core import config
+from deep_next.core.steps.gather_project_knowledge import cache
+from deep_next.core.steps.gather_project_knowledge.cache import (
+    cache_project_knowledge,
+    project_knowledge_cache_key,
+    read_cached_project_knowledge,
+)
+
+_path = config.ROOT_DIR / "tests" / "_resources" / "example_project"
+
+
+@pytest.fixture(autouse=True)
+def _tmp_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path / "cache")
+
+
+def _read(root_path: Path) -> str | None:
+    return read_cached_project_knowledge(project_knowledge_cache_key(root_path))
+
+
+def _write(root_path: Path, project_knowledge: str) -> None:
+    cache_project_knowledge(project_knowledge_cache_key(root_path), project_knowledge)
+
+
+def test_project_knowledge_cached_per_content() -> None:
+    with tmp_git_dir(_path) as git_root_dir:
+        assert _read(git_root_dir) is None
+
+        _write(git_root_dir, "knowledge")
+        assert _read(git_root_dir) == "knowledge"
+
+        new_file_path = git_root_dir / "src" / "new.py"
+        new_file_path.write_text("x = 1\n")
+        assert _read(git_root_dir) is None
+
+        _write(git_root_dir, "new knowledge")
+        assert _read(git_root_dir) == "new knowledge"
+
+        new_file_path.write_text("x = 22\n")
+        assert _read(git_root_dir) is None
+
+        new_file_path.unlink()
+        assert _read(git_root_dir) == "knowledge"
+
+
+def test_project_knowledge_cache_key_follows_llm_setup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    with tmp_git_dir(_path) as git_root_dir:
+        _write(git_root_dir, "knowledge")
+
+        monkeypatch.setattr(cache, "_CACHE_VERSION", cache._CACHE_VERSION + 1)
+        assert _read(git_root_dir) is None
+
+        llm_config = LLMConfig.load(LLMConfigType.ACTION_PLAN)
+        _write(git_root_dir, "new knowledge")
+        monkeypatch.setattr(
+            LLMConfig,
+            "load",
+            lambda *_, **__: llm_config.model_copy(update={"temperature": 0.123}),
+        )
+        assert _read(git_root_dir) is None
+
+
+def test_project_knowledge_not_cached_outside_git_repo(tmp_path: Path) -> None:
+    assert project_knowledge_cache_key(tmp_path) is None
+
+    cache_project_knowledge(None, "knowledge")
+    assert read_cached_project_knowledge(None) is None
+
+
+def test_project_knowledge_cached_with_non_utf8_changes() -> None:
+    with tmp_git_dir(_path) as git_root_dir:
+        (git_root_dir / "src" / "hello_world.py").write_bytes(b"# \xe9\n")
+
+        _write(git_root_dir, "knowledge")
+        assert _read(git_root_dir) == "knowledge"
+
+
+def test_project_knowledge_not_cached_on_key_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _fail(_: Path) -> None:
+        raise FileNotFoundError("untracked file removed")
+
+    monkeypatch.setattr(cache, "_content_key", _fail)
+
+    with tmp_git_dir(_path) as git_root_dir:
+        assert project_knowledge_cache_key(git_root_dir) is None
+
+
+def test_project_knowledge_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache, "_MAX_CACHE_ENTRIES", 2)
+
+    for mtime, key in enumerate(("a", "b")):
+        cache_project_knowledge(key, key)
+        os.utime(cache._CACHE_DIR / f"pk_{key}.txt", ns=(mtime, mtime))
+    cache_project_knowledge("c", "c")
+
+    assert read_cached_project_knowledge("a") is None
+    assert read_cached_project_knowledge("b") == "b"
+    assert read_cached_project_knowledge("c") == "c"
+    assert not list(cache._CACHE_DIR.glob("*.tmp"))